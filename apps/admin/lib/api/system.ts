@@ -70,6 +70,7 @@ export interface EnvConfigUpdate {
   // Polling Engine
   MAX_POLLING_GROUPS?: number;
   DATA_QUEUE_SIZE?: number;
+  MONITOR_MOCK?: boolean;
 
   // PLC Connection Pool
   POOL_SIZE_PER_PLC?: number;
@@ -19,15 +19,40 @@ _current_file = Path(__file__).resolve()  # .../backend/src/api/dependencies.py
 _backend_dir = _current_file.parent.parent.parent  # .../backend
 DB_PATH = str(_backend_dir / "data" / "scada.db")
 
+# Idle SQLite connections kept for reuse across API requests
+DB_POOL_SIZE = 8
+
 
 # ==============================================================================
 # Database Dependency
 # ==============================================================================
 
-def get_db():
+# Shared manager over the pooled connections; built once by warm_db_pool() at startup
+_shared_db: Optional[SQLiteManager] = None
+
+
+def get_shared_db() -> SQLiteManager:
+    """
+    Get the process-wide SQLiteManager, building it on first use
+
+    Building one runs mkdir on the data directory and logs, so the API builds
+    it in warm_db_pool() at startup rather than on the first request.
+    """
+    global _shared_db
+    if _shared_db is None:
+        _shared_db = SQLiteManager(DB_PATH, pool_size=DB_POOL_SIZE)
+    return _shared_db
+
+
+async def get_db():
     """
     Dependency for database access
 
+    Declared async so FastAPI resolves it on the event loop instead of
+    spending a threadpool hop per request; it yields the shared SQLiteManager
+    built by warm_db_pool() at startup, so no filesystem work happens here.
+    Route handlers stay sync (sqlite3 blocks) and run in the threadpool.
+
     Yields:
         SQLiteManager instance
 
@@ -36,12 +61,18 @@ def get_db():
         def get_lines(db: SQLiteManager = Depends(get_db)):
             ...
     """
-    db = SQLiteManager(DB_PATH)
-    try:
-        yield db
-    finally:
-        # SQLiteManager uses context managers, no explicit cleanup needed
-        pass
+    # Connections are returned to the shared pool by get_connection(), no explicit cleanup needed
+    yield get_shared_db()
+
+
+def warm_db_pool() -> int:
+    """
+    Build the shared SQLiteManager, apply index migrations and open the pooled connections at startup
+
+    Returns:
+        Number of connections opened
+    """
+    return get_shared_db().warm_pool()
 
 
 # ==============================================================================
@@ -86,15 +86,13 @@ def list_machines(
 
     Returns paginated list of machines
     """
-    # Get total count
-    with db.get_connection() as conn:
+    # Total count and page on one read-only connection
+    with db.get_connection(read_only=True) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM machines")
         total_count = cursor.fetchone()[0]
 
-    # Get paginated machines
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
+        # Get paginated machines
         cursor.execute("""
             SELECT * FROM machines
             ORDER BY id DESC
@@ -197,6 +195,11 @@ def sync_machines_from_oracle(db: SQLiteManager = Depends(get_db)):
         with db.get_connection() as conn:
             cursor = conn.cursor()
 
+            # Existing machine codes in one query (INSERT vs UPDATE is decided in Python)
+            existing_codes = {
+                row[0] for row in cursor.execute("SELECT machine_code FROM machines")
+            }
+
             for oracle_machine in oracle_machines:
                 machine_code = oracle_machine['machine_code']
                 machine_name = oracle_machine['machine_name']
@@ -204,16 +207,8 @@ def sync_machines_from_oracle(db: SQLiteManager = Depends(get_db)):
                 is_active = oracle_machine.get('is_active', 1)
 
                 try:
-                    # Check if machine exists in SQLite
-                    cursor.execute(
-                        "SELECT id FROM machines WHERE machine_code = ?",
-                        (machine_code,)
-                    )
-                    existing = cursor.fetchone()
-
-                    if existing:
+                    if machine_code in existing_codes:
                         # UPDATE existing machine
-                        machine_id = existing[0]
                         cursor.execute("""
                             UPDATE machines
                             SET machine_name = ?,
@@ -230,6 +225,7 @@ def sync_machines_from_oracle(db: SQLiteManager = Depends(get_db)):
                             INSERT INTO machines (machine_code, machine_name, location, is_active)
                             VALUES (?, ?, ?, ?)
                         """, (machine_code, machine_name, location, is_active))
+                        existing_codes.add(machine_code)
                         created_count += 1
                         logger.info(f"Created machine: {machine_code}")
 
@@ -4,18 +4,21 @@ FastAPI Application
 Main FastAPI application for polling engine REST API.
 """
 
+import asyncio
 import logging
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from src.polling.polling_engine import PollingEngine
 from src.plc.pool_manager import PoolManager
 from src.config.logging_config import initialize_logging
+from src.database.sqlite_manager import SQLiteManager
 from .polling_routes import router as polling_router, set_polling_engine
 from .websocket_handler import websocket_endpoint, set_websocket_engine
 from .buffer_routes import router as buffer_router, set_buffer_components
-from .system_routes import router as system_router, set_system_engine
+from .system_routes import router as system_router, set_system_engine, run_cpu_sampler
 from .machines_routes import router as machines_router
 from .workstages_routes import router as workstages_router
 from .plc_connections_routes import router as plc_connections_router
@@ -26,6 +29,7 @@ from .logs_routes import router as logs_router
 from .websocket_monitor import websocket_monitor_endpoint, set_monitor_engine
 from .monitor_routes import router as monitor_router
 from .oracle_data_routes import router as oracle_data_router
+from .dependencies import warm_db_pool
 
 # Initialize logging on module import
 initialize_logging()
@@ -97,16 +101,25 @@ async def lifespan(app: FastAPI):
     set_monitor_engine(polling_engine)
     set_system_engine(polling_engine)
 
+    # Open the API's SQLite connections (WAL, PRAGMAs) before the first request
+    warmed = warm_db_pool()
+    logger.info(f"✅ SQLite connection pool ready ({warmed} connection(s))")
+
+    # Sample CPU usage in the background for the dashboard
+    cpu_sampler_task = asyncio.create_task(run_cpu_sampler())
+
     logger.info("✅ SCADA API Server ready (polling groups stopped)")
 
     yield
 
     # Shutdown
     logger.info("Shutting down SCADA API Server...")
+    cpu_sampler_task.cancel()
     if polling_group_manager:
         polling_group_manager.shutdown()
     if pool_manager:
         pool_manager.shutdown()
+    SQLiteManager.close_pools()
     logger.info("Shutdown complete")
 
 
@@ -115,7 +128,8 @@ app = FastAPI(
     title="Polling Engine API",
     description="REST API for multi-threaded PLC polling engine control and monitoring",
     version="1.0.1",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # Native JSON encoding for all routes
 )
 
 # CORS middleware
@@ -235,4 +249,5 @@ async def websocket_monitor_route(websocket: WebSocket):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # WebSocket keepalive via protocol PING frames (see websocket_handler)
+    uvicorn.run(app, host="0.0.0.0", port=8000, ws_ping_interval=30.0, ws_ping_timeout=20.0)
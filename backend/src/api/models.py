@@ -29,6 +29,11 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page_size: int
 
 
+class CursorPaginatedResponse(PaginatedResponse[T], Generic[T]):
+    """Paginated response with a keyset cursor for the next page (None on the last page)"""
+    next_cursor: Optional[int] = None
+
+
 class ErrorResponse(BaseModel):
     """Standard error response"""
     error: str
@@ -328,7 +328,7 @@ def get_data_summary(
             WHERE CTIME >= :t
             GROUP BY DATATAG_TYPE
         """, {"t": time_threshold})
-        type_counts = {row[0]: row[1] for row in cursor.fetchall()}
+        type_counts = dict(cursor.fetchall())
 
         cursor.close()
         connection.close()
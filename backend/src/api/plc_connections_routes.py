@@ -13,7 +13,8 @@ from .dependencies import get_db, PaginationParams, log_crud_operation
 from .exceptions import raise_not_found
 from src.database.validators import (
     validate_plc_code_unique,
-    validate_ipv4_address
+    validate_ipv4_address,
+    invalidate_tag_lookups
 )
 from src.plc.mc3e_client import MC3EClient
 import time
@@ -71,6 +72,7 @@ def create_plc_connection(plc: PLCConnectionCreate, db: SQLiteManager = Depends(
         ))
         conn.commit()
         plc_id = cursor.lastrowid
+    invalidate_tag_lookups()
 
     # Log operation
     log_crud_operation("CREATE", "PLC Connection", plc_id, success=True)
@@ -118,15 +120,13 @@ def list_plc_connections(
 
     Returns paginated list of PLC connections
     """
-    # Get total count
-    with db.get_connection() as conn:
+    # Total count and page on one read-only connection
+    with db.get_connection(read_only=True) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM plc_connections")
         total_count = cursor.fetchone()[0]
 
-    # Get paginated PLC connections
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
+        # Get paginated PLC connections
         cursor.execute("""
             SELECT * FROM plc_connections
             ORDER BY id DESC
@@ -235,6 +235,9 @@ def sync_plcs_from_oracle(db: SQLiteManager = Depends(get_db)):
         error_details = []
 
         with db.get_connection() as conn:
+            # One explicit write transaction for the whole sync (single commit); IMMEDIATE
+            # takes the write lock before the existence checks so they stay valid
+            conn.execute("BEGIN IMMEDIATE")
             cursor = conn.cursor()
 
             for oracle_plc in oracle_plcs:
@@ -272,7 +275,7 @@ def sync_plcs_from_oracle(db: SQLiteManager = Depends(get_db)):
                             WHERE plc_code = ?
                         """, (plc_name, plc_spec, plc_type, ip_address, port, 'MC_3E_ASCII', network_no, station_no, plc_code))
                         updated_count += 1
-                        logger.debug(f"Updated PLC: {plc_code}")
+                        logger.debug("Updated PLC: %s", plc_code)
 
                     else:
                         # INSERT new PLC
@@ -282,7 +285,7 @@ def sync_plcs_from_oracle(db: SQLiteManager = Depends(get_db)):
                             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
                         """, (plc_code, plc_name, plc_spec, plc_type, ip_address, port, 'MC_3E_ASCII', network_no, station_no))
                         created_count += 1
-                        logger.debug(f"Created PLC: {plc_code}")
+                        logger.debug("Created PLC: %s", plc_code)
 
                 except Exception as e:
                     error_count += 1
@@ -293,6 +296,7 @@ def sync_plcs_from_oracle(db: SQLiteManager = Depends(get_db)):
 
             # Commit all changes
             conn.commit()
+        invalidate_tag_lookups()
 
         logger.info(
             f"PLC sync completed: {created_count} created, "
@@ -583,6 +587,7 @@ def update_plc_connection(
         query = f"UPDATE plc_connections SET {', '.join(updates)} WHERE id = ?"
         cursor.execute(query, params)
         conn.commit()
+    invalidate_tag_lookups()
 
     # Log operation
     log_crud_operation("UPDATE", "PLC Connection", plc_id, success=True)
@@ -618,6 +623,7 @@ def delete_plc_connection(plc_id: int, db: SQLiteManager = Depends(get_db)):
         cursor = conn.cursor()
         cursor.execute("DELETE FROM plc_connections WHERE id = ?", (plc_id,))
         conn.commit()
+    invalidate_tag_lookups()
 
     # Log operation
     log_crud_operation("DELETE", "PLC Connection", plc_id, success=True)
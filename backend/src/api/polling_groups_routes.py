@@ -6,12 +6,14 @@ Provides CRUD operations for polling groups
 """
 
 import logging
+from datetime import datetime
 from typing import List
 from fastapi import APIRouter, Depends, status
 from src.database.sqlite_manager import SQLiteManager
 from .models import PollingGroupCreate, PollingGroupUpdate, PollingGroupResponse, TagResponse, PaginatedResponse
 from .dependencies import get_db, PaginationParams, log_crud_operation
 from .exceptions import raise_not_found
+from .tags_routes import invalidate_tag_caches
 from src.database.validators import (
     validate_plc_exists,
     validate_polling_mode
@@ -80,6 +82,9 @@ def create_polling_group(group: PollingGroupCreate, db: SQLiteManager = Depends(
 
         conn.commit()
 
+    if group.tag_ids:
+        invalidate_tag_caches()
+
     # Log operation
     log_crud_operation("CREATE", "Polling Group", group_id, success=True)
 
@@ -111,15 +116,13 @@ def list_polling_groups(
     params_count = (plc_code,) if plc_code else ()
     params_list = (plc_code, pagination.limit, pagination.skip) if plc_code else (pagination.limit, pagination.skip)
 
-    # Get total count
-    with db.get_connection() as conn:
+    # Total count and page on one read-only connection
+    with db.get_connection(read_only=True) as conn:
         cursor = conn.cursor()
         cursor.execute(f"SELECT COUNT(*) FROM polling_groups {where_clause}", params_count)
         total_count = cursor.fetchone()[0]
 
-    # Get paginated polling groups
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
+        # Get paginated polling groups
         cursor.execute(f"""
             SELECT * FROM polling_groups
             {where_clause}
@@ -183,7 +186,7 @@ def get_polling_group_tags(group_id: int, db: SQLiteManager = Depends(get_db)):
             raise_not_found("Polling Group", group_id)
 
     # Get tags in group (is_active='Y'인 태그만 반환)
-    with db.get_connection() as conn:
+    with db.get_connection(read_only=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT * FROM tags
@@ -193,8 +196,7 @@ def get_polling_group_tags(group_id: int, db: SQLiteManager = Depends(get_db)):
         """, (group_id,))
         rows = cursor.fetchall()
 
-    tags = [_row_to_tag_response(row) for row in rows]
-    return tags
+    return [_row_to_tag_response(row) for row in rows]
 
 
 # ==============================================================================
@@ -296,6 +298,9 @@ def update_polling_group(
 
         conn.commit()
 
+    if group_update.tag_ids is not None:
+        invalidate_tag_caches()
+
     # Log operation
     log_crud_operation("UPDATE", "Polling Group", group_id, success=True)
 
@@ -634,6 +639,9 @@ def delete_polling_group(group_id: int, db: SQLiteManager = Depends(get_db)):
         cursor.execute("DELETE FROM polling_groups WHERE id = ?", (group_id,))
         conn.commit()
 
+    # Tags referencing the group are affected (see the note above)
+    invalidate_tag_caches()
+
     # Log operation
     log_crud_operation("DELETE", "Polling Group", group_id, success=True)
 
@@ -651,9 +659,8 @@ def _row_to_polling_group_response(row) -> PollingGroupResponse:
     group_id = row[0]
 
     # Count tags in this polling group
-    from .dependencies import get_db
-    db = next(get_db())
-    with db.get_connection() as conn:
+    from .dependencies import get_shared_db
+    with get_shared_db().get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM tags WHERE polling_group_id = ? AND is_active = 1", (group_id,))
         tag_count = cursor.fetchone()[0]
@@ -682,25 +689,31 @@ def _row_to_polling_group_response(row) -> PollingGroupResponse:
 
 
 def _row_to_tag_response(row) -> TagResponse:
-    """Convert database row to TagResponse (for /tags endpoint)"""
-    # Row format from PRAGMA table_info:
-    # 0:id, 1:plc_code, 2:workstage_code, 3:tag_address, 4:tag_name, 5:tag_type,
-    # 6:unit, 7:scale, 8:offset, 9:min_value, 10:max_value, 11:polling_group_id,
-    # 12:description, 13:is_active, 14:last_value, 15:last_updated_at, 16:created_at,
-    # 17:updated_at, 18:tag_category, 19:log_mode, 20:machine_code
-    from datetime import datetime
-    return TagResponse(
-        id=row[0],
-        plc_code=row[1],
-        tag_address=row[3],
-        tag_name=row[4],
-        tag_division=row[18] if len(row) > 18 and row[18] else '',  # tag_category
-        data_type=row[5],  # tag_type
-        unit=str(row[6]) if row[6] else None,
-        scale=float(row[7]) if row[7] is not None else 1.0,
-        machine_code=str(row[20]) if len(row) > 20 and row[20] is not None else None,
-        polling_group_id=row[11],  # polling_group_id is at index 11
-        enabled=bool(row[13]),  # is_active
-        created_at=row[16] if row[16] else datetime.now().isoformat(),
-        updated_at=row[17] if row[17] else datetime.now().isoformat()
+    """
+    Convert database row to TagResponse (for /tags endpoint)
+
+    Columns are read by name and the model is built with model_construct()
+    (DB rows are trusted, so per-field validation is skipped).
+    """
+    created_at = row['created_at']
+    updated_at = row['updated_at']
+    # Only fall back to now() for legacy rows without timestamps
+    if not (created_at and updated_at):
+        now = datetime.now().isoformat()
+        created_at = created_at or now
+        updated_at = updated_at or now
+    return TagResponse.model_construct(
+        id=row['id'],
+        plc_code=row['plc_code'],
+        tag_address=row['tag_address'],
+        tag_name=row['tag_name'],
+        tag_division=row['tag_category'] or '',
+        data_type=row['tag_type'],
+        unit=str(row['unit']) if row['unit'] else None,
+        scale=float(row['scale']) if row['scale'] is not None else 1.0,
+        machine_code=str(row['machine_code']) if row['machine_code'] is not None else None,
+        polling_group_id=row['polling_group_id'],
+        enabled=bool(row['is_active']),
+        created_at=created_at,
+        updated_at=updated_at
     )
@@ -393,7 +393,7 @@ def sync_processes_from_oracle(db: SQLiteManager = Depends(get_db)):
                             WHERE process_code = ?
                         """, (process_name, description, sequence_order, process_code))
                         updated_count += 1
-                        logger.debug(f"Updated process: {process_code}")
+                        logger.debug("Updated process: %s", process_code)
 
                     else:
                         # INSERT new process (without machine_code and plc_id - will be set later)
@@ -403,7 +403,7 @@ def sync_processes_from_oracle(db: SQLiteManager = Depends(get_db)):
                             VALUES (?, ?, ?, ?, 1)
                         """, (process_code, process_name, description, sequence_order))
                         created_count += 1
-                        logger.debug(f"Created process: {process_code}")
+                        logger.debug("Created process: %s", process_code)
 
                 except Exception as e:
                     error_count += 1
@@ -4,13 +4,22 @@ System Control API Routes
 Provides endpoints to start/stop the SCADA system and check its status.
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Optional, Dict, List
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Dict, List, NamedTuple, Tuple
 from datetime import datetime
+import asyncio
+import hashlib
 import os
+import re
+import time
 from pathlib import Path
 import logging
+import orjson
+
+from src.oracle_writer.config import load_config_from_env, load_cached_config
+from src.oracle_writer.oracle_helper import OracleHelper
 
 router = APIRouter(prefix="/api/system", tags=["system"])
 logger = logging.getLogger(__name__)
@@ -18,15 +27,72 @@ logger = logging.getLogger(__name__)
 # Global engine instance (will be set by main app)
 _polling_engine = None
 _system_started_at: Optional[datetime] = None
+_system_started_at_iso: Optional[str] = None  # Cached ISO string of _system_started_at
+_system_started_monotonic: Optional[float] = None  # time.monotonic() at start, for uptime
+_restart_lock = asyncio.Lock()
+_env_update_lock = asyncio.Lock()  # Serializes .env read-modify-write in update_env_config
+
+# Dashboard PLC query, kept as one constant so sqlite3's statement cache always hits
+_SQL_ACTIVE_PLCS = "SELECT id, plc_name, last_connected_at FROM plc_connections WHERE is_active = 1"
+
+# Upper bound for /test-oracle-connection (connect + SELECT 1 FROM DUAL), seconds
+_ORACLE_TEST_TIMEOUT = 5.0
+
+# Latest CPU usage, refreshed by run_cpu_sampler() so /dashboard never blocks
+_last_cpu: float = 0.0
+
+
+class _EngineCaps(NamedTuple):
+    """Capabilities of the polling engine, probed once in set_system_engine()"""
+    has_pool_manager: bool = False
+    has_data_buffer: bool = False
+    buffer_has_size: bool = False
+    buffer_has_queue: bool = False
+
+
+_engine_caps = _EngineCaps()
 
 
 def set_system_engine(engine):
     """Set the global polling engine instance"""
-    global _polling_engine
+    global _polling_engine, _engine_caps
     _polling_engine = engine
 
+    # Probe optional attributes once instead of on every request
+    buffer = getattr(engine, 'data_buffer', None)
+    _engine_caps = _EngineCaps(
+        has_pool_manager=hasattr(engine, 'pool_manager'),
+        has_data_buffer=buffer is not None,
+        buffer_has_size=hasattr(buffer, 'size'),
+        buffer_has_queue=hasattr(buffer, '_queue'),
+    )
+
+
+async def run_cpu_sampler(interval: float = 1.0):
+    """
+    Keep _last_cpu up to date in the background
+
+    psutil.cpu_percent(None) is non-blocking and reports usage since the
+    previous call, so one sampler replaces a 100 ms sleep per request.
+    Started from the application lifespan and cancelled on shutdown.
+    """
+    global _last_cpu
+    import psutil
+
+    psutil.cpu_percent(interval=None)
+    while True:
+        await asyncio.sleep(interval)
+        _last_cpu = psutil.cpu_percent(interval=None)
+
+
+def _is_engine_initialized() -> bool:
+    """Return whether the polling engine has been initialized"""
+    return bool(getattr(_polling_engine, '_initialized', False))
+
 
 class SystemStatusResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     status: str  # "stopped", "starting", "running", "stopping"
     started_at: Optional[str] = None
     uptime_seconds: Optional[int] = None
@@ -34,6 +100,35 @@ class SystemStatusResponse(BaseModel):
     polling_groups_running: int = 0
 
 
+def _start_impl() -> None:
+    """Initialize the polling engine and record the start time (raises on failure)"""
+    global _system_started_at, _system_started_at_iso, _system_started_monotonic
+
+    # Initialize polling engine (loads polling groups from database)
+    _polling_engine.initialize()
+    _system_started_at = datetime.now()
+    _system_started_at_iso = _system_started_at.isoformat()
+    _system_started_monotonic = time.monotonic()
+
+    # Optionally auto-start all polling groups
+    # Uncomment if you want auto-start behavior:
+    # _polling_engine.start_all()
+
+
+def _stop_impl() -> None:
+    """Stop all polling groups and shut down the engine (raises on failure)"""
+    global _system_started_at, _system_started_at_iso, _system_started_monotonic
+
+    # Stop all polling groups first
+    _polling_engine.stop_all(timeout=5.0)
+
+    # Shutdown engine
+    _polling_engine.shutdown()
+    _system_started_at = None
+    _system_started_at_iso = None
+    _system_started_monotonic = None
+
+
 @router.post("/start")
 async def start_system():
     """
@@ -41,8 +136,6 @@ async def start_system():
 
     This must be called before the system can collect data from PLCs.
     """
-    global _system_started_at
-
     if not _polling_engine:
         raise HTTPException(
             status_code=503,
@@ -50,7 +143,7 @@ async def start_system():
         )
 
     # Check if already initialized
-    if hasattr(_polling_engine, '_initialized') and _polling_engine._initialized:
+    if _is_engine_initialized():
         return {
             "success": False,
             "message": "System is already running",
@@ -58,19 +151,13 @@ async def start_system():
         }
 
     try:
-        # Initialize polling engine (loads polling groups from database)
-        _polling_engine.initialize()
-        _system_started_at = datetime.now()
-
-        # Optionally auto-start all polling groups
-        # Uncomment if you want auto-start behavior:
-        # _polling_engine.start_all()
+        _start_impl()
 
         return {
             "success": True,
             "message": "System started successfully. Polling groups are loaded but not running. Use /api/polling/start-all to start polling.",
             "status": "running",
-            "started_at": _system_started_at.isoformat()
+            "started_at": _system_started_at_iso
         }
     except Exception as e:
         raise HTTPException(
@@ -86,15 +173,13 @@ async def stop_system():
 
     This will gracefully stop all data collection.
     """
-    global _system_started_at
-
     if not _polling_engine:
         raise HTTPException(
             status_code=503,
             detail="Polling engine not available"
         )
 
-    if not hasattr(_polling_engine, '_initialized') or not _polling_engine._initialized:
+    if not _is_engine_initialized():
         return {
             "success": False,
             "message": "System is already stopped",
@@ -102,12 +187,7 @@ async def stop_system():
         }
 
     try:
-        # Stop all polling groups first
-        _polling_engine.stop_all(timeout=5.0)
-
-        # Shutdown engine
-        _polling_engine.shutdown()
-        _system_started_at = None
+        _stop_impl()
 
         return {
             "success": True,
@@ -121,51 +201,71 @@ async def stop_system():
         )
 
 
-@router.get("/status", response_model=SystemStatusResponse)
-async def get_system_status():
+def _not_modified(request: Request, response: Response, fingerprint: tuple) -> bool:
     """
-    Get current system status
+    Set a weak ETag for the fingerprint and report whether the client already has it
 
-    Returns whether the system is running, uptime, and polling group statistics.
+    The ETag is a digest of the JSON-encoded fingerprint, so it is the same
+    across restarts and workers (unlike hash(), which is salted per process).
+
+    Returns:
+        True if If-None-Match matches, i.e. the caller should answer 304
     """
-    if not _polling_engine:
-        return SystemStatusResponse(
-            status="unavailable",
-            polling_groups_loaded=0,
-            polling_groups_running=0
-        )
+    digest = hashlib.blake2b(orjson.dumps(fingerprint), digest_size=8).hexdigest()
+    etag = f'W/"{digest}"'
+    response.headers["ETag"] = etag
 
-    is_initialized = hasattr(_polling_engine, '_initialized') and _polling_engine._initialized
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    # If-None-Match may list several ETags (weak comparison) or be "*"
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
 
-    if not is_initialized:
-        return SystemStatusResponse(
-            status="stopped",
-            polling_groups_loaded=0,
-            polling_groups_running=0
-        )
 
-    # Get polling groups status
-    try:
-        groups_status = _polling_engine.get_status_all()
-        running_count = sum(1 for g in groups_status if g.get('state') == 'running')
-
-        uptime_seconds = None
-        if _system_started_at:
-            uptime_seconds = int((datetime.now() - _system_started_at).total_seconds())
-
-        return SystemStatusResponse(
-            status="running",
-            started_at=_system_started_at.isoformat() if _system_started_at else None,
-            uptime_seconds=uptime_seconds,
-            polling_groups_loaded=len(groups_status),
-            polling_groups_running=running_count
-        )
-    except Exception as e:
-        return SystemStatusResponse(
-            status="error",
-            polling_groups_loaded=0,
-            polling_groups_running=0
-        )
+@router.get("/status", response_model=SystemStatusResponse, response_class=ORJSONResponse)
+async def get_system_status(request: Request, response: Response):
+    """
+    Get current system status
+
+    Returns whether the system is running, uptime, and polling group statistics.
+    Responds 304 Not Modified when the client's ETag is still current (the ETag
+    covers the whole body, so a running engine's uptime still reaches the client).
+    """
+    status = "running"
+    started_at = None
+    uptime_seconds = None
+    groups_loaded = 0
+    groups_running = 0
+
+    if not _polling_engine:
+        status = "unavailable"
+    elif not _is_engine_initialized():
+        status = "stopped"
+    else:
+        # Get polling groups status
+        try:
+            # Only the counts are needed here, so skip building per-group status dicts
+            groups_running = _polling_engine.running_count()
+            groups_loaded = _polling_engine.group_count()
+
+            started_at = _system_started_at_iso
+            if _system_started_monotonic is not None:
+                uptime_seconds = int(time.monotonic() - _system_started_monotonic)
+        except Exception:
+            status = "error"
+            groups_loaded = groups_running = 0
+
+    if _not_modified(request, response, (status, started_at, uptime_seconds, groups_loaded, groups_running)):
+        return Response(status_code=304, headers={"ETag": response.headers["ETag"]})
+
+    return SystemStatusResponse(
+        status=status,
+        started_at=started_at,
+        uptime_seconds=uptime_seconds,
+        polling_groups_loaded=groups_loaded,
+        polling_groups_running=groups_running
+    )
 
 
 @router.post("/restart")
@@ -175,21 +275,23 @@ async def restart_system():
 
     Useful for reloading configuration changes.
     """
-    # Stop system
-    stop_result = await stop_system()
-    if not stop_result.get("success", False) and stop_result.get("status") != "stopped":
+    if not _polling_engine:
         raise HTTPException(
-            status_code=500,
-            detail="Failed to stop system during restart"
+            status_code=503,
+            detail="Polling engine not available"
         )
 
-    # Start system
-    start_result = await start_system()
-    if not start_result.get("success", False):
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to start system during restart"
-        )
+    # Serialize concurrent restarts so they don't race on the shared engine
+    async with _restart_lock:
+        try:
+            if _is_engine_initialized():
+                _stop_impl()
+            _start_impl()
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to restart system: {str(e)}"
+            )
 
     return {
         "success": True,
@@ -199,6 +301,8 @@ async def restart_system():
 
 
 class PLCStatusItem(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     plc_id: int
     plc_name: str
     is_online: bool
@@ -206,6 +310,8 @@ class PLCStatusItem(BaseModel):
 
 
 class SystemInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     cpu_percent: float
     memory_used_gb: float
     memory_total_gb: float
@@ -217,6 +323,8 @@ class SystemInfo(BaseModel):
 
 
 class BufferInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     current_size: int
     max_size: int
     utilization_percent: float
@@ -225,6 +333,8 @@ class BufferInfo(BaseModel):
 
 
 class OracleWriterInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     success_count: int = 0
     fail_count: int = 0
     success_rate_percent: float = 0.0
@@ -232,6 +342,8 @@ class OracleWriterInfo(BaseModel):
 
 
 class DashboardDataResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     system: SystemInfo
     plc_status: List[PLCStatusItem] = []
     active_polling_groups: int = 0
@@ -240,7 +352,7 @@ class DashboardDataResponse(BaseModel):
     oracle_writer: OracleWriterInfo
 
 
-@router.get("/dashboard", response_model=DashboardDataResponse)
+@router.get("/dashboard", response_model=DashboardDataResponse, response_class=ORJSONResponse)
 async def get_dashboard_data():
     """
     Get comprehensive dashboard data including system resources and SCADA status
@@ -248,11 +360,10 @@ async def get_dashboard_data():
     Returns CPU, memory, disk usage, PLC connections, polling groups, and buffer status.
     """
     import psutil
-    from src.api.dependencies import DB_PATH
-    from src.database.sqlite_manager import SQLiteManager
+    from src.api.dependencies import get_shared_db
 
     # Get system resource usage
-    cpu_usage = psutil.cpu_percent(interval=0.1)
+    cpu_usage = _last_cpu
     memory = psutil.virtual_memory()
     disk = psutil.disk_usage('/')
 
@@ -266,57 +377,52 @@ async def get_dashboard_data():
     overflow_count = 0
 
     # Get PLC list from database
-    db = SQLiteManager(DB_PATH)
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, plc_name, last_connected_at
-            FROM plc_connections
-            WHERE is_active = 1
-        """)
-        plc_rows = cursor.fetchall()
-
-        for plc_row in plc_rows:
-            plc_id, plc_name, last_connected = plc_row
-            # Check if PLC is online (connected in last 5 minutes)
-            is_online = False
-            last_seen = None
-
-            if last_connected:
-                last_seen = last_connected
-                # Simple check: if engine is running and has this PLC pool
-                if _polling_engine and hasattr(_polling_engine, 'pool_manager'):
-                    is_online = plc_id in _polling_engine.pool_manager._pools
-
-            plc_status_list.append(PLCStatusItem(
-                plc_id=plc_id,
-                plc_name=plc_name,
-                is_online=is_online,
-                last_seen=last_seen
-            ))
+    with get_shared_db().get_connection(read_only=True) as conn:
+        cursor = conn.execute(_SQL_ACTIVE_PLCS)
+
+        # Pool membership is only meaningful when the engine exposes a pool manager
+        online_ids = (
+            _polling_engine.pool_manager._pools
+            if _polling_engine and _engine_caps.has_pool_manager
+            else ()
+        )
 
-        cursor.close()
+        # Rows come from our own database, so skip pydantic validation per item
+        while True:
+            plc_rows = cursor.fetchmany(512)
+            if not plc_rows:
+                break
+
+            for row in plc_rows:
+                last_seen = row["last_connected_at"]
+                plc_status_list.append(PLCStatusItem.model_construct(
+                    plc_id=row["id"],
+                    plc_name=row["plc_name"],
+                    is_online=bool(last_seen) and row["id"] in online_ids,
+                    # TIMESTAMP columns may come back as datetime (PARSE_DECLTYPES)
+                    last_seen=str(last_seen) if last_seen else None
+                ))
 
     # Get SCADA-specific data if engine is available
-    if _polling_engine and hasattr(_polling_engine, '_initialized') and _polling_engine._initialized:
+    if _polling_engine and _is_engine_initialized():
         try:
             # Get polling groups status
-            groups_status = _polling_engine.get_status_all()
-            groups_total = len(groups_status)
-            groups_running = sum(1 for g in groups_status if g.get('state') == 'running')
+            groups_total = _polling_engine.group_count()
+            groups_running = _polling_engine.running_count()
 
             # Get buffer status
-            if hasattr(_polling_engine, 'data_buffer'):
+            if _engine_caps.has_data_buffer:
                 buffer = _polling_engine.data_buffer
-                buffer_size = buffer.size() if hasattr(buffer, 'size') else 0
-                buffer_max = buffer._queue.maxsize if hasattr(buffer, '_queue') else 10000
+                buffer_size = buffer.size() if _engine_caps.buffer_has_size else 0
+                buffer_max = buffer._queue.maxsize if _engine_caps.buffer_has_queue else 10000
                 buffer_util = (buffer_size / buffer_max * 100) if buffer_max > 0 else 0.0
         except Exception as e:
             # Log error but continue with default values
             logger.error(f"Error getting SCADA data: {e}")
 
-    return DashboardDataResponse(
-        system=SystemInfo(
+    # All values are computed server-side, so build the payload without re-validation
+    return DashboardDataResponse.model_construct(
+        system=SystemInfo.model_construct(
             cpu_percent=cpu_usage,
             memory_used_gb=round(memory.used / (1024**3), 2),
             memory_total_gb=round(memory.total / (1024**3), 2),
@@ -329,13 +435,13 @@ async def get_dashboard_data():
         plc_status=plc_status_list,
         active_polling_groups=groups_running,
         total_polling_groups=groups_total,
-        buffer=BufferInfo(
+        buffer=BufferInfo.model_construct(
             current_size=buffer_size,
             max_size=buffer_max,
             utilization_percent=round(buffer_util, 2),
             overflow_count=overflow_count
         ),
-        oracle_writer=OracleWriterInfo()
+        oracle_writer=OracleWriterInfo.model_construct()
     )
 
 
@@ -345,6 +451,8 @@ async def get_dashboard_data():
 
 class EnvConfigUpdate(BaseModel):
     """Request model for updating environment configuration"""
+    model_config = ConfigDict(extra='ignore')
+
     # Database
     DATABASE_PATH: Optional[str] = None
 
@@ -363,6 +471,7 @@ class EnvConfigUpdate(BaseModel):
     # Polling Engine
     MAX_POLLING_GROUPS: Optional[int] = None
     DATA_QUEUE_SIZE: Optional[int] = None
+    MONITOR_MOCK: Optional[bool] = None
 
     # PLC Connection Pool
     POOL_SIZE_PER_PLC: Optional[int] = None
@@ -384,6 +493,13 @@ class EnvConfigUpdate(BaseModel):
     BUFFER_WRITE_INTERVAL: Optional[float] = None
 
 
+# Fields written to .env as 'true'/'false' rather than str(bool)
+_BOOL_FIELDS = frozenset(
+    name for name, field in EnvConfigUpdate.model_fields.items()
+    if field.annotation == Optional[bool]
+)
+
+
 def get_env_file_path() -> Path:
     """Get the path to the .env file"""
     # Assuming the backend directory structure
@@ -392,53 +508,87 @@ def get_env_file_path() -> Path:
     return env_path
 
 
+# KEY=VALUE lines; blank lines, comments and lines without '=' never match.
+# Key and value are captured without surrounding whitespace.
+_ENV_LINE_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+
 def parse_env_file(env_path: Path) -> Dict[str, str]:
     """Parse .env file and return key-value pairs"""
-    env_vars = {}
-
     if not env_path.exists():
-        return env_vars
+        return {}
+
+    # One regex pass over the whole file instead of a strip/split per line
+    return dict(_ENV_LINE_RE.findall(env_path.read_text(encoding='utf-8')))
 
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
 
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
+# Parsed .env contents keyed by file and mtime: (env_path, st_mtime_ns, env_vars)
+_ENV_CACHE: Optional[Tuple[Path, int, Dict[str, str]]] = None
 
-            # Parse KEY=VALUE
-            if '=' in line:
-                key, value = line.split('=', 1)
-                env_vars[key.strip()] = value.strip()
 
-    return env_vars
+def _get_env_cached(env_path: Path) -> Dict[str, str]:
+    """
+    Return parsed .env contents, re-parsing only when the file's mtime changes
+
+    Returns a copy, so callers may modify the result freely.
+    """
+    global _ENV_CACHE
+
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _ENV_CACHE = None
+        return {}
+
+    if _ENV_CACHE is None or _ENV_CACHE[:2] != (env_path, mtime_ns):
+        _ENV_CACHE = (env_path, mtime_ns, parse_env_file(env_path))
+
+    return dict(_ENV_CACHE[2])
+
+
+# .env layout: (section comment, keys written in that section). Keys outside it are dropped.
+_ENV_GROUPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Database", ("DATABASE_PATH",)),
+    ("API Server", ("API_HOST", "API_PORT", "API_RELOAD")),
+    ("CORS Origins", ("CORS_ORIGINS",)),
+    ("Logging", ("LOG_LEVEL", "LOG_DIR", "LOG_COLORS", "LOG_MAX_BYTES", "LOG_BACKUP_COUNT")),
+    ("Polling Engine", ("MAX_POLLING_GROUPS", "DATA_QUEUE_SIZE", "WEBSOCKET_BROADCAST_INTERVAL",
+                        "MONITOR_MOCK")),
+    ("PLC Connection Pool", ("POOL_SIZE_PER_PLC", "CONNECTION_TIMEOUT", "READ_TIMEOUT", "IDLE_TIMEOUT")),
+    ("Oracle Database", ("ORACLE_HOST", "ORACLE_PORT", "ORACLE_SERVICE_NAME", "ORACLE_USERNAME",
+                         "ORACLE_PASSWORD", "ORACLE_POOL_MIN", "ORACLE_POOL_MAX")),
+    ("Buffer Configuration", ("BUFFER_MAX_SIZE", "BUFFER_BATCH_SIZE", "BUFFER_BATCH_SIZE_MAX",
+                              "BUFFER_WRITE_INTERVAL", "BUFFER_RETRY_COUNT", "BACKUP_FILE_PATH")),
+)
+
+_ENV_HEADER = (
+    "# JSScada Backend Environment Configuration\n"
+    "# Auto-generated by System Settings\n\n"
+)
 
 
 def write_env_file(env_path: Path, env_vars: Dict[str, str]):
     """Write environment variables to .env file"""
+    global _ENV_CACHE
+
+    # Build the whole file first, then write it with a single call
+    parts = [_ENV_HEADER]
+    # Track exactly what is written (keys outside the groups are dropped)
+    written: Dict[str, str] = {}
+
+    for group_name, keys in _ENV_GROUPS:
+        parts.append(f"# {group_name}\n")
+        for key in keys:
+            if key in env_vars:
+                parts.append(f"{key}={env_vars[key]}\n")
+                written[key] = str(env_vars[key]).strip()
+        parts.append("\n")
+
     with open(env_path, 'w', encoding='utf-8') as f:
-        f.write("# JSScada Backend Environment Configuration\n")
-        f.write("# Auto-generated by System Settings\n\n")
-
-        # Group configurations
-        groups = {
-            "Database": ["DATABASE_PATH"],
-            "API Server": ["API_HOST", "API_PORT", "API_RELOAD"],
-            "CORS Origins": ["CORS_ORIGINS"],
-            "Logging": ["LOG_LEVEL", "LOG_DIR", "LOG_COLORS", "LOG_MAX_BYTES", "LOG_BACKUP_COUNT"],
-            "Polling Engine": ["MAX_POLLING_GROUPS", "DATA_QUEUE_SIZE", "WEBSOCKET_BROADCAST_INTERVAL"],
-            "PLC Connection Pool": ["POOL_SIZE_PER_PLC", "CONNECTION_TIMEOUT", "READ_TIMEOUT", "IDLE_TIMEOUT"],
-            "Oracle Database": ["ORACLE_HOST", "ORACLE_PORT", "ORACLE_SERVICE_NAME", "ORACLE_USERNAME", "ORACLE_PASSWORD", "ORACLE_POOL_MIN", "ORACLE_POOL_MAX"],
-            "Buffer Configuration": ["BUFFER_MAX_SIZE", "BUFFER_BATCH_SIZE", "BUFFER_BATCH_SIZE_MAX", "BUFFER_WRITE_INTERVAL", "BUFFER_RETRY_COUNT", "BACKUP_FILE_PATH"],
-        }
+        f.write("".join(parts))
 
-        for group_name, keys in groups.items():
-            f.write(f"# {group_name}\n")
-            for key in keys:
-                if key in env_vars:
-                    f.write(f"{key}={env_vars[key]}\n")
-            f.write("\n")
+    # Refresh the cache directly instead of re-parsing the file we just wrote
+    _ENV_CACHE = (env_path, env_path.stat().st_mtime_ns, written)
 
 
 @router.get("/env-config")
@@ -450,7 +600,8 @@ async def get_env_config() -> Dict[str, str]:
     """
     try:
         env_path = get_env_file_path()
-        env_vars = parse_env_file(env_path)
+        # File I/O runs in a worker thread so the event loop is not blocked
+        env_vars = await asyncio.to_thread(_get_env_cached, env_path)
 
         # Mask sensitive information
         if 'ORACLE_PASSWORD' in env_vars:
@@ -483,20 +634,19 @@ async def update_env_config(config: EnvConfigUpdate) -> EnvConfigUpdateResponse:
     try:
         env_path = get_env_file_path()
 
-        # Read current configuration
-        env_vars = parse_env_file(env_path)
+        async with _env_update_lock:
+            # Read current configuration (file I/O runs in a worker thread)
+            env_vars = await asyncio.to_thread(_get_env_cached, env_path)
 
-        # Update with new values (only non-null fields)
-        update_data = config.dict(exclude_none=True)
-        for key, value in update_data.items():
-            # Convert boolean to string
-            if isinstance(value, bool):
-                value = 'true' if value else 'false'
-            # Convert to string
-            env_vars[key] = str(value)
+            # Update with new values (only non-null fields)
+            update_data = config.model_dump(exclude_none=True)
+            for key, value in update_data.items():
+                # Booleans are written as 'true'/'false', everything else as str()
+                env_vars[key] = ('true' if value else 'false') if key in _BOOL_FIELDS else str(value)
 
-        # Write back to file
-        write_env_file(env_path, env_vars)
+            # Write back to file
+            await asyncio.to_thread(write_env_file, env_path, env_vars)
+            load_cached_config.cache_clear()
 
         # Mask sensitive information in response
         if 'ORACLE_PASSWORD' in env_vars:
@@ -523,46 +673,60 @@ class OracleConnectionTestResponse(BaseModel):
     error_details: Optional[str] = None
 
 
+def _run_oracle_connection_test() -> OracleConnectionTestResponse:
+    """Connect to Oracle and run SELECT 1 FROM DUAL (blocking; run in a worker thread)"""
+    # Load Oracle configuration
+    config = load_config_from_env()
+
+    # Attempt to connect
+    with OracleHelper() as oracle:
+        # Simple test query
+        cursor = oracle.connection.cursor()
+        cursor.execute("SELECT 1 FROM DUAL")
+        result = cursor.fetchone()
+        cursor.close()
+
+    if result:
+        return OracleConnectionTestResponse(
+            success=True,
+            message="Oracle 데이터베이스 연결 성공",
+            connection_info={
+                "host": config.host,
+                "port": str(config.port),
+                "service_name": config.service_name,
+                "username": config.username,
+                "dsn": config.get_dsn()
+            }
+        )
+    return OracleConnectionTestResponse(
+        success=False,
+        message="Oracle 연결 테스트 쿼리 실패",
+        error_details="SELECT 1 FROM DUAL returned no result"
+    )
+
+
 @router.post("/test-oracle-connection")
 async def test_oracle_connection() -> OracleConnectionTestResponse:
     """
     Test Oracle database connection with current configuration
 
+    The blocking Oracle connect runs in a worker thread and is bounded by
+    _ORACLE_TEST_TIMEOUT seconds.
+
     Returns connection status and details
     """
     try:
-        from src.oracle_writer.config import load_config_from_env
-        from src.oracle_writer.oracle_helper import OracleHelper
-
-        # Load Oracle configuration
-        config = load_config_from_env()
-
-        # Attempt to connect
-        with OracleHelper() as oracle:
-            # Simple test query
-            cursor = oracle.connection.cursor()
-            cursor.execute("SELECT 1 FROM DUAL")
-            result = cursor.fetchone()
-            cursor.close()
-
-            if result:
-                return OracleConnectionTestResponse(
-                    success=True,
-                    message="Oracle 데이터베이스 연결 성공",
-                    connection_info={
-                        "host": config.host,
-                        "port": str(config.port),
-                        "service_name": config.service_name,
-                        "username": config.username,
-                        "dsn": config.get_dsn()
-                    }
-                )
-            else:
-                return OracleConnectionTestResponse(
-                    success=False,
-                    message="Oracle 연결 테스트 쿼리 실패",
-                    error_details="SELECT 1 FROM DUAL returned no result"
-                )
+        return await asyncio.wait_for(
+            asyncio.to_thread(_run_oracle_connection_test),
+            timeout=_ORACLE_TEST_TIMEOUT
+        )
+
+    except asyncio.TimeoutError:
+        return OracleConnectionTestResponse(
+            success=False,
+            message="Oracle 데이터베이스 연결 실패",
+            error_details=f"Connection test timed out after {_ORACLE_TEST_TIMEOUT:.0f}s"
+        )
 
     except Exception as e:
         error_message = str(e)
@@ -5,21 +5,114 @@ Feature 5: Database Management REST API
 Provides CRUD operations for PLC tags including CSV bulk import
 """
 
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from fastapi import APIRouter, Depends, status, UploadFile, File, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from src.database.sqlite_manager import SQLiteManager
-from .models import TagCreate, TagUpdate, TagResponse, TagImportResult, PaginatedResponse
+from .models import TagCreate, TagUpdate, TagResponse, TagImportResult, CursorPaginatedResponse
 from .dependencies import get_db, PaginationParams, log_crud_operation
 from .exceptions import raise_not_found
 from src.database.validators import (
-    validate_polling_group_exists
+    validate_tag_fks,
+    get_known_plc_codes
 )
-import pandas as pd
+from src.oracle_writer.config import load_cached_config
+from src.oracle_writer.oracle_helper import get_oracle_tags
+from src.config.logging_config import get_logger
+import csv
 import io
+import orjson
+import sqlite3
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/tags", tags=["tags"])
 
+# INSERT/UPDATE ... RETURNING requires SQLite 3.35+
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Hot single-row statements, one SQL text each so every caller hits the same
+# entry in the connection's prepared-statement cache
+_SQL_SELECT_TAG = "SELECT * FROM tags WHERE id = ?"
+_SQL_DELETE_TAG = "DELETE FROM tags WHERE id = ?"
+
+# Tag INSERT statements, built once (create_tag / import_tags_csv)
+_TAG_INSERT_BODY = """INTO tags (
+        plc_code, polling_group_id, tag_address, tag_name, tag_type,
+        unit, scale, machine_code, log_mode, description, is_active
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_INSERT_TAG_SQL = "INSERT " + _TAG_INSERT_BODY
+_INSERT_TAG_RETURNING_SQL = _INSERT_TAG_SQL + " RETURNING *"
+# CSV import: duplicates (UNIQUE plc_code, tag_address) are skipped and reported afterwards.
+# ON CONFLICT only suppresses that key; OR IGNORE would also skip NOT NULL/CHECK failures.
+_IMPORT_TAG_SQL = "INSERT " + _TAG_INSERT_BODY + " ON CONFLICT(plc_code, tag_address) DO NOTHING"
+_SQL_IMPORT_LAST_ID = "SELECT COALESCE(MAX(id), 0) FROM tags"
+_SQL_IMPORT_KEYS_SINCE = "SELECT plc_code, tag_address FROM tags WHERE id > ?"
+
+# list_tags filter columns, in the order their parameters are bound
+_LIST_TAGS_FILTERS = ("plc_code", "machine_code", "polling_group_id", "tag_category", "is_active")
+
+# Oracle tag sync: one UPSERT per tag on the UNIQUE(plc_code, tag_address) key;
+# created/updated counts come from the row count before and after
+_SQL_SYNC_COUNT_TAGS = "SELECT COUNT(*) FROM tags"
+_SQL_SYNC_UPSERT_TAG = """
+    INSERT INTO tags
+    (plc_code, tag_address, tag_name, tag_category, tag_type,
+     unit, scale, min_value, max_value, machine_code, is_active)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(plc_code, tag_address) DO UPDATE SET
+        tag_name = excluded.tag_name,
+        tag_category = excluded.tag_category,
+        tag_type = excluded.tag_type,
+        unit = excluded.unit,
+        scale = excluded.scale,
+        min_value = excluded.min_value,
+        max_value = excluded.max_value,
+        machine_code = excluded.machine_code,
+        is_active = excluded.is_active,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# delete_tags_batch: ids per DELETE ... IN (...) (SQLite may cap bound variables at 999)
+_DELETE_BATCH_SIZE = 500
+_SQL_DELETE_TAG_CHUNK = f"DELETE FROM tags WHERE id IN ({','.join('?' * _DELETE_BATCH_SIZE)})"
+# Larger batches are staged in a connection-local temp table and deleted in one statement
+_DELETE_TEMP_TABLE_MIN = 5000
+_SQL_DELETE_IDS_CREATE = "CREATE TEMP TABLE IF NOT EXISTS delete_tag_ids (id INTEGER PRIMARY KEY)"
+_SQL_DELETE_IDS_CLEAR = "DELETE FROM delete_tag_ids"
+_SQL_DELETE_IDS_INSERT = "INSERT OR IGNORE INTO delete_tag_ids (id) VALUES (?)"
+_SQL_DELETE_TAGS_STAGED = "DELETE FROM tags WHERE id IN (SELECT id FROM delete_tag_ids)"
+
+# list_tags pages of at least this many rows are streamed instead of buffered
+_STREAM_MIN_LIMIT = 200
+# CSV import: rows validated and inserted per executemany batch
+_IMPORT_CHUNK_ROWS = 5000
+
+# Rows fetched and encoded per streamed chunk (each chunk is one threadpool hop)
+_STREAM_BATCH_ROWS = 256
+
+# Every committed tag write bumps the generation, which retires all cached
+# categories and list totals below. Bumped under a lock: writes run in threadpool workers.
+_tags_generation = 0
+_tags_generation_lock = threading.Lock()
+
+# get_tag_categories: db_path -> (generation, loaded_at, categories)
+_CATEGORIES_TTL_SECONDS = 60.0
+_categories_cache: Dict[str, Tuple[int, float, List[str]]] = {}
+
+# list_tags totals: (db_path, filter columns, filter values) -> (generation, loaded_at, total).
+# A hit lets the page query skip its COUNT subquery; the short TTL bounds drift from
+# writes made outside this process.
+_TOTALS_TTL_SECONDS = 10.0
+_TOTALS_CACHE_MAX = 256
+_totals_cache: Dict[tuple, Tuple[int, float, int]] = {}
+
 
 # ==============================================================================
 # POST /api/tags - Create new tag
@@ -50,56 +143,58 @@ def create_tag(tag: TagCreate, db: SQLiteManager = Depends(get_db)):
     if not tag.machine_code or not tag.machine_code.strip():
         raise HTTPException(status_code=400, detail="machine_code cannot be empty")
 
-    if tag.polling_group_id is not None:
-        validate_polling_group_exists(db, tag.polling_group_id)
-
     # 태그명이 "unknown"이면 is_active를 'N'으로 설정
     is_active = tag.enabled
     if tag.tag_name and tag.tag_name.lower() == "unknown":
         is_active = False
 
+    insert_params = (
+        tag.plc_code.strip(),
+        tag.polling_group_id,
+        tag.tag_address,
+        tag.tag_name,
+        tag.data_type,  # tag_type
+        tag.unit,
+        tag.scale,
+        tag.machine_code.strip(),
+        tag.log_mode,  # log_mode
+        tag.tag_division,  # description
+        is_active  # is_active (unknown이면 False)
+    )
+
     with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO tags (
-                plc_code, polling_group_id, tag_address, tag_name, tag_type,
-                unit, scale, machine_code, log_mode, description, is_active
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            tag.plc_code.strip(),
-            tag.polling_group_id,
-            tag.tag_address,
-            tag.tag_name,
-            tag.data_type,  # tag_type
-            tag.unit,
-            tag.scale,
-            tag.machine_code.strip(),
-            tag.log_mode,  # log_mode
-            tag.tag_division,  # description
-            is_active  # is_active (unknown이면 False)
-        ))
+        # Polling group reference, checked on the same connection as the INSERT
+        validate_tag_fks(db, polling_group_id=tag.polling_group_id, conn=conn)
+
+        # Read the created row back in the same statement when SQLite supports it
+        if _SQLITE_HAS_RETURNING:
+            row = conn.execute(_INSERT_TAG_RETURNING_SQL, insert_params).fetchone()
+        else:
+            cursor = conn.execute(_INSERT_TAG_SQL, insert_params)
+            row = conn.execute(_SQL_SELECT_TAG, (cursor.lastrowid,)).fetchone()
         conn.commit()
-        tag_id = cursor.lastrowid
+
+    invalidate_tag_caches()
 
     # Log operation
-    log_crud_operation("CREATE", "Tag", tag_id, success=True)
+    log_crud_operation("CREATE", "Tag", row["id"], success=True)
 
     # Return created tag
-    return get_tag(tag_id, db)
+    return _row_to_tag_response(row)
 
 
 # ==============================================================================
 # GET /api/tags - List all tags with pagination
 # ==============================================================================
 
-@router.get("", response_model=PaginatedResponse[TagResponse])
+@router.get("", response_model=CursorPaginatedResponse[TagResponse])
 def list_tags(
     plc_code: Optional[str] = None,
     machine_code: Optional[str] = None,
     polling_group_id: Optional[int] = None,
     tag_category: Optional[str] = None,
     is_active: Optional[bool] = None,
+    cursor: Optional[int] = None,
     pagination: PaginationParams = Depends(),
     db: SQLiteManager = Depends(get_db)
 ):
@@ -111,59 +206,70 @@ def list_tags(
     - **polling_group_id**: Optional filter by polling group ID
     - **tag_category**: Optional filter by tag category (tag type)
     - **is_active**: Optional filter by active status (true/false)
+    - **cursor**: Optional keyset cursor (next_cursor of the previous page);
+      returns tags with id below it and ignores page
     - **page**: Page number (default: 1)
     - **limit**: Items per page (default: 50, max: 1000)
 
-    Returns paginated list of tags
+    Returns paginated list of tags; next_cursor is set while more rows may follow
     """
-    # Build WHERE clause
-    conditions = []
-    params = []
-
-    if plc_code:
-        conditions.append("t.plc_code = ?")
-        params.append(plc_code)
-    if machine_code:
-        conditions.append("t.machine_code = ?")
-        params.append(machine_code)
-    if polling_group_id:
-        conditions.append("t.polling_group_id = ?")
-        params.append(polling_group_id)
-    if tag_category:
-        conditions.append("t.tag_category = ?")
-        params.append(tag_category)
-    if is_active is not None:
-        conditions.append("t.is_active = ?")
-        params.append(1 if is_active else 0)
-
-    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-    # Get total count
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM tags t {where_clause}", params)
-        total_count = cursor.fetchone()[0]
-
-    # Get paginated tags
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(f"""
-            SELECT t.*
-            FROM tags t
-            {where_clause}
-            ORDER BY t.id DESC
-            LIMIT ? OFFSET ?
-        """, params + [pagination.limit, pagination.skip])
-        rows = cursor.fetchall()
+    # Collect active filters; SQL text is built once per filter combination
+    filter_values = {
+        "plc_code": plc_code or None,
+        "machine_code": machine_code or None,
+        "polling_group_id": polling_group_id or None,
+        "tag_category": tag_category or None,
+        "is_active": None if is_active is None else int(is_active),
+    }
+    active = tuple(col for col in _LIST_TAGS_FILTERS if filter_values[col] is not None)
+    params = [filter_values[col] for col in active]
+    keyset = cursor is not None
+
+    # A recently computed total for these filters lets the page query skip counting
+    total_key = (str(db.db_path), active, tuple(params))
+    generation = _tags_generation
+    cached_total = _cached_list_total(total_key, generation)
+    with_total = cached_total is None
+    count_sql, select_sql = _list_tags_sql(active, keyset, with_total)
+
+    # Filter params are bound twice when the page also counts: once for the total
+    # subquery, once for the page. Keyset pages seek below the cursor id instead of
+    # skipping OFFSET rows.
+    select_params = params + params if with_total else list(params)
+    if keyset:
+        select_params += [cursor, pagination.limit, 0]
+    else:
+        select_params += [pagination.limit, pagination.skip]
+    first_page = not keyset and pagination.skip == 0
+
+    # Large pages: encode rows while sending instead of building the whole body first
+    if pagination.limit >= _STREAM_MIN_LIMIT:
+        return StreamingResponse(
+            _stream_tags_page(
+                db, count_sql, select_sql, params, select_params, pagination, first_page,
+                cached_total, total_key, generation
+            ),
+            media_type="application/json"
+        )
 
-    tags = [_row_to_tag_response(row) for row in rows]
+    # Page rows and total count in one statement
+    with db.get_connection(read_only=True) as conn:
+        rows = conn.execute(select_sql, select_params).fetchall()
+        if cached_total is None:
+            total_count = _page_total(conn, rows, count_sql, params, first_page)
+            _store_list_total(total_key, generation, total_count)
+        else:
+            total_count = cached_total
 
     metadata = pagination.get_pagination_metadata(total_count)
 
-    return PaginatedResponse(
-        items=tags,
-        **metadata
-    )
+    # Rows are already TagResponse-shaped; encode the dicts directly with orjson
+    # instead of re-validating them against the response_model
+    return ORJSONResponse({
+        **metadata,
+        "items": [_row_to_tag_fields(row) for row in rows],
+        "next_cursor": rows[-1]['id'] if len(rows) == pagination.limit else None,
+    })
 
 
 # ==============================================================================
@@ -176,8 +282,16 @@ def get_tag_categories(db: SQLiteManager = Depends(get_db)):
     Get list of distinct tag categories (tag types) from database
 
     Returns list of unique tag_category values for filter dropdown
+    (cached for up to 60 seconds; any tag write clears the cache)
     """
-    with db.get_connection() as conn:
+    generation = _tags_generation
+    key = str(db.db_path)
+    now = time.monotonic()
+    cached = _categories_cache.get(key)
+    if cached is not None and cached[0] == generation and now - cached[1] < _CATEGORIES_TTL_SECONDS:
+        return {"categories": cached[2]}
+
+    with db.get_connection(read_only=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT DISTINCT tag_category
@@ -188,6 +302,9 @@ def get_tag_categories(db: SQLiteManager = Depends(get_db)):
         rows = cursor.fetchall()
 
     categories = [row[0] for row in rows]
+    # Tagged with the generation read before the query, so a write that races
+    # with this read still forces the next call to reload
+    _categories_cache[key] = (generation, now, categories)
     return {"categories": categories}
 
 
@@ -202,7 +319,7 @@ def get_machine_codes(db: SQLiteManager = Depends(get_db)):
 
     Returns list of unique machine_code values for filter dropdown
     """
-    with db.get_connection() as conn:
+    with db.get_connection(read_only=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT DISTINCT machine_code
@@ -228,16 +345,8 @@ def get_oracle_connection_info():
     Returns connection details for Oracle sync confirmation dialog
     """
     try:
-        from src.oracle_writer.config import load_config_from_env
-        from src.config.logging_config import get_logger
-
-        logger = get_logger(__name__)
-        config = load_config_from_env()
-        return config.to_dict()
+        return load_cached_config().to_dict()
     except Exception as e:
-        from src.config.logging_config import get_logger
-
-        logger = get_logger(__name__)
         logger.error(f"Failed to load Oracle config: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -271,26 +380,22 @@ def sync_tags_from_oracle(db: SQLiteManager = Depends(get_db)):
             "error_details": []
         }
     """
-    from src.oracle_writer.oracle_helper import get_oracle_tags
-    from src.config.logging_config import get_logger
-
-    logger = get_logger(__name__)
-
     try:
         # Fetch tags from Oracle
         logger.info("Starting Oracle tag synchronization...")
         oracle_tags = get_oracle_tags()
         logger.info(f"Fetched {len(oracle_tags)} tags from Oracle")
 
-        created_count = 0
-        updated_count = 0
         skipped_count = 0
         error_count = 0
         error_details = []
 
         with db.get_connection() as conn:
-            cursor = conn.cursor()
+            # Take the write lock up front so the before/after row counts stay valid
+            conn.execute("BEGIN IMMEDIATE")
+            count_before = conn.execute(_SQL_SYNC_COUNT_TAGS).fetchone()[0]
 
+            upserts = []
             for oracle_tag in oracle_tags:
                 plc_code = oracle_tag['plc_code']
                 machine_code = oracle_tag.get('machine_code')
@@ -303,74 +408,45 @@ def sync_tags_from_oracle(db: SQLiteManager = Depends(get_db)):
                 min_value = oracle_tag.get('min_value')
                 max_value = oracle_tag.get('max_value')
 
-                try:
-                    # Validate required codes
-                    if not plc_code or not plc_code.strip():
-                        error_count += 1
-                        error_msg = f"Missing plc_code for tag {tag_address}"
-                        error_details.append(error_msg)
-                        logger.warning(error_msg)
-                        continue
-
-                    if not machine_code or not machine_code.strip():
-                        error_count += 1
-                        error_msg = f"Missing machine_code for tag {tag_address}"
-                        error_details.append(error_msg)
-                        logger.warning(error_msg)
-                        continue
-
-                    # Check if tag exists
-                    cursor.execute(
-                        "SELECT id FROM tags WHERE plc_code = ? AND tag_address = ?",
-                        (plc_code, tag_address)
-                    )
-                    existing = cursor.fetchone()
-
-                    # 태그명이 "unknown"이면 is_active=0, 아니면 1
-                    is_active = 0 if tag_name.lower() == "unknown" else 1
-
-                    if existing:
-                        # UPDATE existing tag
-                        cursor.execute("""
-                            UPDATE tags
-                            SET tag_name = ?,
-                                tag_category = ?,
-                                tag_type = ?,
-                                unit = ?,
-                                scale = ?,
-                                min_value = ?,
-                                max_value = ?,
-                                machine_code = ?,
-                                is_active = ?,
-                                updated_at = CURRENT_TIMESTAMP
-                            WHERE plc_code = ? AND tag_address = ?
-                        """, (tag_name, tag_category, tag_type, unit, scale, min_value, max_value,
-                              machine_code, is_active, plc_code, tag_address))
-                        updated_count += 1
-                        logger.debug(f"Updated tag: {plc_code}/{tag_address}")
-
-                    else:
-                        # INSERT new tag
-                        cursor.execute("""
-                            INSERT INTO tags
-                            (plc_code, tag_address, tag_name, tag_category, tag_type,
-                             unit, scale, min_value, max_value, machine_code, is_active)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (plc_code, tag_address, tag_name, tag_category, tag_type,
-                              unit, scale, min_value, max_value, machine_code, is_active))
-                        created_count += 1
-                        logger.debug(f"Created tag: {plc_code}/{tag_address}")
-
-                except Exception as e:
+                # Validate required codes
+                if not plc_code or not plc_code.strip():
+                    error_count += 1
+                    error_msg = f"Missing plc_code for tag {tag_address}"
+                    error_details.append(error_msg)
+                    logger.warning(error_msg)
+                    continue
+
+                if not machine_code or not machine_code.strip():
                     error_count += 1
-                    error_msg = f"Error processing tag {plc_code}/{tag_address}: {str(e)}"
+                    error_msg = f"Missing machine_code for tag {tag_address}"
                     error_details.append(error_msg)
-                    logger.error(error_msg)
+                    logger.warning(error_msg)
                     continue
 
+                # 태그명이 "unknown"이면 is_active=0, 아니면 1
+                is_active = 0 if tag_name.lower() == "unknown" else 1
+
+                upserts.append((
+                    plc_code, tag_address, tag_name, tag_category, tag_type,
+                    unit, scale, min_value, max_value, machine_code, is_active
+                ))
+
+            # Insert new tags and update existing ones in one executemany
+            failed, sync_errors = _execute_sync_batch(conn, _SQL_SYNC_UPSERT_TAG, upserts)
+
+            # Rows that did not add a tag updated one (repeats in the feed count as updates)
+            created_count = conn.execute(_SQL_SYNC_COUNT_TAGS).fetchone()[0] - count_before
+            updated_count = len(upserts) - len(failed) - created_count
+            for error_msg in sync_errors:
+                logger.error(error_msg)
+            error_details.extend(sync_errors)
+            error_count += len(sync_errors)
+
             # Commit all changes
             conn.commit()
 
+        invalidate_tag_caches()
+
         logger.info(
             f"Tag sync completed: {created_count} created, "
             f"{updated_count} updated, {error_count} errors"
@@ -394,6 +470,53 @@ def sync_tags_from_oracle(db: SQLiteManager = Depends(get_db)):
         )
 
 
+# ==============================================================================
+# DELETE /api/tags/batch - Batch delete tags (MUST be before /{tag_id} route)
+# ==============================================================================
+
+@router.delete("/batch", status_code=status.HTTP_204_NO_CONTENT)
+def delete_tags_batch(tag_ids: List[int], db: SQLiteManager = Depends(get_db)):
+    """
+    Batch delete multiple tags
+
+    - **tag_ids**: List of tag IDs to delete
+
+    Returns 204 No Content on success
+    """
+    if not tag_ids:
+        return
+
+    # One write transaction, one commit, whichever path is taken
+    full = len(tag_ids) - len(tag_ids) % _DELETE_BATCH_SIZE
+    deleted_count = 0
+    with db.get_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        if len(tag_ids) >= _DELETE_TEMP_TABLE_MIN:
+            # Very large batches: stage the ids with one executemany, then delete
+            # with a single set-based statement instead of many IN-list statements
+            conn.execute(_SQL_DELETE_IDS_CREATE)
+            conn.executemany(_SQL_DELETE_IDS_INSERT, [(tag_id,) for tag_id in tag_ids])
+            deleted_count = conn.execute(_SQL_DELETE_TAGS_STAGED).rowcount
+            conn.execute(_SQL_DELETE_IDS_CLEAR)
+        else:
+            # Full chunks share one fixed-size IN-list statement (under SQLite's
+            # bound-variable limit); the remainder goes through executemany so only
+            # two statement shapes are ever prepared
+            for start in range(0, full, _DELETE_BATCH_SIZE):
+                chunk = tag_ids[start:start + _DELETE_BATCH_SIZE]
+                deleted_count += conn.execute(_SQL_DELETE_TAG_CHUNK, chunk).rowcount
+            if full < len(tag_ids):
+                deleted_count += conn.executemany(
+                    _SQL_DELETE_TAG, [(tag_id,) for tag_id in tag_ids[full:]]
+                ).rowcount
+        conn.commit()
+
+    invalidate_tag_caches()
+
+    # Log operation
+    log_crud_operation("BATCH_DELETE", "Tag", success=True, error=f"Deleted {deleted_count} tags")
+
+
 # ==============================================================================
 # GET /api/tags/{id} - Get single tag by ID
 # ==============================================================================
@@ -407,10 +530,8 @@ def get_tag(tag_id: int, db: SQLiteManager = Depends(get_db)):
 
     Returns tag details
     """
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tags WHERE id = ?", (tag_id,))
-        row = cursor.fetchone()
+    with db.get_connection(read_only=True) as conn:
+        row = _fetch_tag_row(conn, tag_id)
 
     if not row:
         raise_not_found("Tag", tag_id)
@@ -442,17 +563,6 @@ def update_tag(
 
     Returns updated tag
     """
-    # Check tag exists
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM tags WHERE id = ?", (tag_id,))
-        if not cursor.fetchone():
-            raise_not_found("Tag", tag_id)
-
-    # Validate polling group if provided
-    if tag_update.polling_group_id is not None:
-        validate_polling_group_exists(db, tag_update.polling_group_id)
-
     # Build update query
     updates = []
     params = []
@@ -500,23 +610,40 @@ def update_tag(
 
     if not updates:
         # No changes, return current tag
-        return get_tag(tag_id, db)
+        with db.get_connection(read_only=True) as conn:
+            row = _fetch_tag_row(conn, tag_id)
+        if row is None:
+            raise_not_found("Tag", tag_id)
+        return _row_to_tag_response(row)
 
     # Add updated_at
     updates.append("updated_at = CURRENT_TIMESTAMP")
     params.append(tag_id)
 
+    # One connection: polling group check, then UPDATE ... RETURNING (a missing tag returns no row)
     with db.get_connection() as conn:
-        cursor = conn.cursor()
+        validate_tag_fks(db, polling_group_id=tag_update.polling_group_id, conn=conn)
+
         query = f"UPDATE tags SET {', '.join(updates)} WHERE id = ?"
-        cursor.execute(query, params)
+        # Read the updated row back in the same statement when SQLite supports it
+        if _SQLITE_HAS_RETURNING:
+            row = conn.execute(query + " RETURNING *", params).fetchone()
+        elif conn.execute(query, params).rowcount:
+            row = _fetch_tag_row(conn, tag_id)
+        else:
+            row = None
         conn.commit()
 
+    if row is None:
+        raise_not_found("Tag", tag_id)
+
+    invalidate_tag_caches()
+
     # Log operation
     log_crud_operation("UPDATE", "Tag", tag_id, success=True)
 
     # Return updated tag
-    return get_tag(tag_id, db)
+    return _row_to_tag_response(row)
 
 
 # ==============================================================================
@@ -532,48 +659,18 @@ def delete_tag(tag_id: int, db: SQLiteManager = Depends(get_db)):
 
     Returns 204 No Content on success
     """
-    # Check tag exists
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM tags WHERE id = ?", (tag_id,))
-        if not cursor.fetchone():
-            raise_not_found("Tag", tag_id)
-
-    # Delete tag
+    # Delete tag; rowcount 0 means it did not exist
     with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
+        deleted = conn.execute(_SQL_DELETE_TAG, (tag_id,)).rowcount
         conn.commit()
 
-    # Log operation
-    log_crud_operation("DELETE", "Tag", tag_id, success=True)
-
-
-# ==============================================================================
-# DELETE /api/tags/batch - Batch delete tags
-# ==============================================================================
-
-@router.delete("/batch", status_code=status.HTTP_204_NO_CONTENT)
-def delete_tags_batch(tag_ids: List[int], db: SQLiteManager = Depends(get_db)):
-    """
-    Batch delete multiple tags
-
-    - **tag_ids**: List of tag IDs to delete
-
-    Returns 204 No Content on success
-    """
-    if not tag_ids:
-        return
+    if not deleted:
+        raise_not_found("Tag", tag_id)
 
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        placeholders = ','.join(['?'] * len(tag_ids))
-        cursor.execute(f"DELETE FROM tags WHERE id IN ({placeholders})", tag_ids)
-        conn.commit()
-        deleted_count = cursor.rowcount
+    invalidate_tag_caches()
 
     # Log operation
-    log_crud_operation("BATCH_DELETE", "Tag", success=True, error=f"Deleted {deleted_count} tags")
+    log_crud_operation("DELETE", "Tag", tag_id, success=True)
 
 
 # ==============================================================================
@@ -581,7 +678,7 @@ def delete_tags_batch(tag_ids: List[int], db: SQLiteManager = Depends(get_db)):
 # ==============================================================================
 
 @router.post("/import-csv", response_model=TagImportResult)
-async def import_tags_csv(
+def import_tags_csv(
     file: UploadFile = File(...),
     db: SQLiteManager = Depends(get_db)
 ):
@@ -589,7 +686,7 @@ async def import_tags_csv(
     Import tags from CSV file
 
     CSV format (columns):
-    - PLC_CODE: PLC code (required)
+    - PLC_CODE: PLC code (required, must exist in plc_connections)
     - MACHINE_CODE: Machine code (required, max 200 chars)
     - TAG_ADDRESS: Tag address (required, max 20 chars)
     - TAG_NAME: Tag name (required, max 200 chars)
@@ -600,7 +697,9 @@ async def import_tags_csv(
     - ENABLED: Enabled flag (optional, default: 1)
 
     Performance:
-    - Processes in chunks of 1000 rows for optimal performance
+    - Sync handler (runs in the threadpool): parsing and inserts never block the event loop
+    - Streams the spooled upload in chunks (memory bounded by chunk size)
+    - Parsed with the stdlib csv reader (no DataFrame per chunk)
     - Target: 3000 tags in <30 seconds
 
     Returns import result with success count, failure count, and errors
@@ -610,106 +709,50 @@ async def import_tags_csv(
     errors = []
 
     try:
-        # Read CSV file
-        contents = await file.read()
-        df = pd.read_csv(io.BytesIO(contents))
+        # Stream the upload chunk by chunk with the stdlib csv reader
+        columns, reader = _read_import_chunks(file.file)
 
-        # Validate required columns
+        # Validate required columns against the header
         required_cols = ['PLC_CODE', 'MACHINE_CODE', 'TAG_ADDRESS', 'TAG_NAME']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = [col for col in required_cols if col not in columns]
         if missing_cols:
             return TagImportResult(
                 success_count=0,
-                failure_count=len(df),
+                failure_count=sum(len(chunk) for chunk in reader),
                 errors=[{"row": 0, "error": f"Missing required columns: {', '.join(missing_cols)}"}]
             )
 
-        # Process in chunks of 1000
-        chunk_size = 1000
-        total_rows = len(df)
-
-        for chunk_start in range(0, total_rows, chunk_size):
-            chunk_end = min(chunk_start + chunk_size, total_rows)
-            chunk = df.iloc[chunk_start:chunk_end]
+        # Registered PLC codes (cached across imports); rows are checked with a set membership test
+        known_plcs = get_known_plc_codes(db)
+        rows_read = 0
+
+        # One connection and one write transaction for the whole import (single commit);
+        # IMMEDIATE takes the write lock up front instead of upgrading mid-import
+        with db.get_connection() as conn, db.tune_for_bulk(conn):
+            conn.execute("BEGIN IMMEDIATE")
+
+            for chunk in reader:
+                # Validate and normalize the chunk into INSERT tuples
+                batch_data, row_nums, chunk_errors = _prepare_import_rows(
+                    chunk, rows_read, columns, known_plcs
+                )
+                rows_read += len(chunk)
+                errors.extend(chunk_errors)
+                failure_count += len(chunk_errors)
+
+                if not batch_data:
+                    continue
 
-            # Prepare batch insert
-            batch_data = []
+                # Insert the chunk under savepoints; a failing batch is bisected so only
+                # the bad rows are rejected (same connection, same transaction)
+                inserted, insert_errors = _insert_import_batch(conn, batch_data, row_nums)
+                success_count += inserted
+                errors.extend(insert_errors)
+                failure_count += len(insert_errors)
 
-            for idx, row in chunk.iterrows():
-                row_num = idx + 2  # CSV row number (1-indexed, +1 for header)
+            conn.commit()
 
-                try:
-                    # Get codes directly
-                    plc_code = str(row['PLC_CODE']).strip()
-                    machine_code = str(row['MACHINE_CODE']).strip()
-
-                    # Validate codes are not empty
-                    if not plc_code:
-                        errors.append({"row": row_num, "error": "PLC_CODE cannot be empty"})
-                        failure_count += 1
-                        continue
-
-                    if not machine_code:
-                        errors.append({"row": row_num, "error": "MACHINE_CODE cannot be empty"})
-                        failure_count += 1
-                        continue
-
-                    # Extract fields
-                    tag_address = str(row['TAG_ADDRESS']).strip()
-                    tag_name = str(row['TAG_NAME']).strip()
-                    tag_division = str(row.get('TAG_DIVISION', '')).strip() or None
-                    data_type = str(row.get('DATA_TYPE', 'WORD')).strip()
-                    unit = str(row.get('UNIT', '')).strip() or None
-                    scale = float(row.get('SCALE', 1.0))
-                    enabled = int(row.get('ENABLED', 1))
-
-                    # 태그명이 "unknown"이면 is_active=0으로 설정
-                    if tag_name.lower() == "unknown":
-                        enabled = 0
-
-                    batch_data.append((
-                        plc_code, None, tag_address, tag_name, data_type,
-                        unit, scale, machine_code, tag_division, enabled
-                    ))
-
-                except Exception as e:
-                    errors.append({"row": row_num, "error": str(e)})
-                    failure_count += 1
-
-            # Batch insert chunk
-            if batch_data:
-                try:
-                    with db.get_connection() as conn:
-                        cursor = conn.cursor()
-                        cursor.executemany("""
-                            INSERT INTO tags (
-                                plc_code, polling_group_id, tag_address, tag_name, tag_type,
-                                unit, scale, machine_code, description, is_active
-                            )
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, batch_data)
-                        conn.commit()
-                        success_count += len(batch_data)
-
-                except Exception as e:
-                    # If batch insert fails, try individual inserts to identify specific errors
-                    for i, data in enumerate(batch_data):
-                        row_num = chunk_start + i + 2
-                        try:
-                            with db.get_connection() as conn:
-                                cursor = conn.cursor()
-                                cursor.execute("""
-                                    INSERT INTO tags (
-                                        plc_code, polling_group_id, tag_address, tag_name, tag_type,
-                                        unit, scale, machine_code, description, is_active
-                                    )
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                """, data)
-                                conn.commit()
-                                success_count += 1
-                        except Exception as e2:
-                            errors.append({"row": row_num, "error": str(e2)})
-                            failure_count += 1
+        invalidate_tag_caches()
 
         # Log operation
         log_crud_operation("CSV_IMPORT", "Tag", success=True, error=f"Imported {success_count} tags, {failure_count} failures")
@@ -732,26 +775,414 @@ async def import_tags_csv(
 # Helper Functions
 # ==============================================================================
 
-def _row_to_tag_response(row) -> TagResponse:
-    """Convert database row to TagResponse"""
-    # Row format (plc_code, machine_code):
-    # (0:id, 1:plc_code, 2:machine_code, 3:tag_address, 4:tag_name, 5:tag_type, 6:unit,
-    #  7:scale, 8:offset, 9:min_value, 10:max_value, 11:polling_group_id, 12:description,
-    #  13:is_active, 14:last_value, 15:last_updated_at, 16:created_at, 17:updated_at,
-    #  18:tag_category, 19:log_mode)
-    return TagResponse(
-        id=row[0],
-        plc_code=row[1] if row[1] else '',
-        machine_code=row[2] if row[2] else '',
-        tag_address=row[3],
-        tag_name=row[4],
-        tag_division=row[12] if row[12] else '',  # description
-        tag_category=row[18] if len(row) > 18 and row[18] else None,  # tag_category
-        data_type=row[5],  # tag_type
-        unit=str(row[6]) if row[6] else None,
-        scale=float(row[7]) if row[7] is not None else 1.0,
-        polling_group_id=row[11],
-        enabled=bool(row[13]),  # is_active
-        created_at=row[16] if row[16] else datetime.now().isoformat(),
-        updated_at=row[17] if row[17] else datetime.now().isoformat()
-    )
+@lru_cache(maxsize=None)
+def _list_tags_sql(
+    active_filters: Tuple[str, ...],
+    keyset: bool = False,
+    with_total: bool = True
+) -> Tuple[str, str]:
+    """
+    Build (COUNT, SELECT) SQL for list_tags for a combination of filter columns
+
+    The SELECT carries the filtered total in a _total column, computed by an
+    uncorrelated subquery that SQLite evaluates once per statement.
+    (COUNT(*) OVER () would materialize every matching row before LIMIT.)
+
+    Args:
+        active_filters: Filter column names, in _LIST_TAGS_FILTERS order
+        keyset: Add "t.id < ?" to the page (not the total) for cursor pagination
+        with_total: Include the _total subquery (False when the total is cached)
+
+    Returns:
+        (count_sql, select_sql); select_sql binds the filter params (twice
+        with_total), then the cursor id (keyset only), then LIMIT ? OFFSET ?
+    """
+    conditions = [f"t.{col} = ?" for col in active_filters]
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    count_sql = f"SELECT COUNT(*) FROM tags t {where_clause}"
+    if keyset:
+        conditions.append("t.id < ?")
+    page_where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    total_column = f", ({count_sql}) AS _total" if with_total else ""
+    select_sql = f"""
+        SELECT t.*{total_column}
+        FROM tags t
+        {page_where}
+        ORDER BY t.id DESC
+        LIMIT ? OFFSET ?
+    """
+    return count_sql, select_sql
+
+
+def _page_total(
+    conn: sqlite3.Connection,
+    rows: List[sqlite3.Row],
+    count_sql: str,
+    params: list,
+    first_page: bool
+) -> int:
+    """
+    Total row count for a list_tags page
+
+    Read from the first row's _total column; an empty page other than the
+    first one falls back to the COUNT query (an empty first page means 0).
+    """
+    if rows:
+        return rows[0]['_total']
+    if not first_page:
+        return conn.execute(count_sql, params).fetchone()[0]
+    return 0
+
+
+def _cached_list_total(key: tuple, generation: int) -> Optional[int]:
+    """Cached list_tags total for a filter combination (None if absent or stale)"""
+    cached = _totals_cache.get(key)
+    if cached is None or cached[0] != generation:
+        return None
+    if time.monotonic() - cached[1] >= _TOTALS_TTL_SECONDS:
+        return None
+    return cached[2]
+
+
+def _store_list_total(key: tuple, generation: int, total: int) -> None:
+    """
+    Remember a list_tags total
+
+    Tagged with the generation read before the query, so a write that races
+    with the read still forces the next call to recount.
+    """
+    if len(_totals_cache) >= _TOTALS_CACHE_MAX:
+        _totals_cache.clear()
+    _totals_cache[key] = (generation, time.monotonic(), total)
+
+
+def _read_import_chunks(source) -> Tuple[Dict[str, int], Iterator[List[List[str]]]]:
+    """
+    Open an import CSV with the stdlib csv reader
+
+    Args:
+        source: Binary file object (the spooled upload)
+
+    Returns:
+        (columns, chunks): header column name -> position, and an iterator of
+        raw row lists of up to _IMPORT_CHUNK_ROWS rows. Blank lines are skipped.
+    """
+    text = io.TextIOWrapper(source, encoding='utf-8-sig', newline='')
+    reader = csv.reader(text)
+    header = next(reader, [])
+    columns = {name: pos for pos, name in reversed(list(enumerate(header)))}
+
+    def chunks() -> Iterator[List[List[str]]]:
+        try:
+            rows = (row for row in reader if row)
+            while True:
+                chunk = list(islice(rows, _IMPORT_CHUNK_ROWS))
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            # Leave the upload file open for FastAPI to close
+            text.detach()
+
+    return columns, chunks()
+
+
+def _prepare_import_rows(
+    chunk: List[List[str]],
+    first_row: int,
+    columns: Dict[str, int],
+    known_plcs: Optional[Set[str]] = None
+) -> Tuple[List[tuple], List[int], List[dict]]:
+    """
+    Validate CSV rows and build INSERT tuples
+
+    Args:
+        chunk: Raw CSV rows (lists of cells)
+        first_row: 0-based data row number of chunk[0]
+        columns: Header column name -> position
+        known_plcs: Registered PLC codes; rows with other codes are rejected
+
+    Returns:
+        (batch_data, row_nums, errors): insert tuples, their CSV row numbers,
+        and error dicts for rejected rows
+    """
+    def position(col: str) -> int:
+        # Missing optional columns read as blank cells
+        return columns.get(col, -1)
+
+    pos_plc = position('PLC_CODE')
+    pos_machine = position('MACHINE_CODE')
+    pos_address = position('TAG_ADDRESS')
+    pos_name = position('TAG_NAME')
+    pos_division = position('TAG_DIVISION')
+    pos_type = position('DATA_TYPE')
+    pos_unit = position('UNIT')
+    pos_scale = position('SCALE')
+    pos_enabled = position('ENABLED')
+
+    batch_data = []
+    row_nums = []
+    errors = []
+    for offset, row in enumerate(chunk):
+        # CSV row number (1-indexed, +1 for header)
+        row_num = first_row + offset + 2
+
+        def cell(pos: int) -> str:
+            return row[pos].strip() if 0 <= pos < len(row) else ''
+
+        plc_code = cell(pos_plc)
+        machine_code = cell(pos_machine)
+        raw_scale = cell(pos_scale)
+        raw_enabled = cell(pos_enabled)
+
+        # The first failing check wins
+        error = None
+        if not plc_code:
+            error = "PLC_CODE cannot be empty"
+        elif known_plcs is not None and plc_code not in known_plcs:
+            error = f"Unknown PLC_CODE: {plc_code}"
+        elif not machine_code:
+            error = "MACHINE_CODE cannot be empty"
+        else:
+            try:
+                scale = float(raw_scale) if raw_scale else 1.0
+                if scale != scale:  # NaN
+                    raise ValueError
+            except ValueError:
+                error = f"Invalid SCALE value: {row[pos_scale]}"
+            else:
+                try:
+                    enabled = int(float(raw_enabled)) if raw_enabled else 1
+                except (ValueError, OverflowError):
+                    error = f"Invalid ENABLED value: {row[pos_enabled]}"
+        if error:
+            errors.append({"row": row_num, "error": error})
+            continue
+
+        tag_name = cell(pos_name)
+
+        # 태그명이 "unknown"이면 is_active=0으로 설정
+        if tag_name.lower() == 'unknown':
+            enabled = 0
+
+        batch_data.append((
+            plc_code,
+            None,  # polling_group_id
+            cell(pos_address),
+            tag_name,
+            cell(pos_type) or 'WORD',  # tag_type
+            cell(pos_unit) or None,  # empty strings are stored as NULL
+            scale,
+            machine_code,
+            'ALWAYS',  # log_mode
+            cell(pos_division) or None,  # description
+            enabled,  # is_active
+        ))
+        row_nums.append(row_num)
+
+    return batch_data, row_nums, errors
+
+
+def _insert_import_batch(
+    conn: sqlite3.Connection,
+    batch_data: List[tuple],
+    row_nums: List[int]
+) -> Tuple[int, List[dict]]:
+    """
+    Insert CSV import rows with one executemany under a savepoint
+
+    Duplicates (UNIQUE plc_code, tag_address) are skipped by ON CONFLICT DO NOTHING
+    and identified afterwards with one scan instead of per-row retries. Any other
+    failure (e.g. a NOT NULL or trigger constraint) rolls the savepoint back and
+    retries each half, so a bad row is isolated in O(log n) batches while the
+    good rows around it are still inserted.
+
+    Returns:
+        (inserted_count, errors) for the given rows
+    """
+    errors = []
+    # Rows inserted by this batch get ids above last_id
+    last_id = conn.execute(_SQL_IMPORT_LAST_ID).fetchone()[0]
+    conn.execute("SAVEPOINT import_batch")
+    try:
+        inserted = conn.executemany(_IMPORT_TAG_SQL, batch_data).rowcount
+    except sqlite3.Error as e:
+        conn.execute("ROLLBACK TO import_batch")
+        conn.execute("RELEASE import_batch")
+        if len(batch_data) == 1:
+            return 0, [{"row": row_nums[0], "error": str(e)}]
+        mid = len(batch_data) // 2
+        left_inserted, left_errors = _insert_import_batch(conn, batch_data[:mid], row_nums[:mid])
+        right_inserted, right_errors = _insert_import_batch(conn, batch_data[mid:], row_nums[mid:])
+        return left_inserted + right_inserted, left_errors + right_errors
+    conn.execute("RELEASE import_batch")
+
+    if inserted < len(batch_data):
+        inserted_keys = {
+            (row[0], row[1]) for row in conn.execute(_SQL_IMPORT_KEYS_SINCE, (last_id,))
+        }
+        for row_num, data in zip(row_nums, batch_data):
+            key = (data[0], data[2])
+            if key in inserted_keys:
+                # First occurrence was inserted; later ones in the batch are duplicates
+                inserted_keys.discard(key)
+            else:
+                errors.append({
+                    "row": row_num,
+                    "error": "UNIQUE constraint failed: tags.plc_code, tags.tag_address"
+                })
+
+    return inserted, errors
+
+
+def _execute_sync_batch(
+    conn: sqlite3.Connection,
+    sql: str,
+    rows: List[tuple]
+) -> Tuple[Set[int], List[str]]:
+    """
+    Run the Oracle sync statement for all rows with executemany
+
+    If the batch fails, it is rolled back to a savepoint and replayed row by
+    row so only the failing tags are reported.
+
+    Args:
+        conn: Connection with an open transaction
+        sql: _SQL_SYNC_UPSERT_TAG
+        rows: Parameter tuples starting with (plc_code, tag_address)
+
+    Returns:
+        (indexes of failed rows, error messages)
+    """
+    if not rows:
+        return set(), []
+
+    conn.execute("SAVEPOINT oracle_sync_batch")
+    try:
+        conn.executemany(sql, rows)
+        conn.execute("RELEASE oracle_sync_batch")
+        return set(), []
+    except sqlite3.Error:
+        conn.execute("ROLLBACK TO oracle_sync_batch")
+
+    failed = set()
+    errors = []
+    for i, row in enumerate(rows):
+        try:
+            conn.execute(sql, row)
+        except sqlite3.Error as e:
+            failed.add(i)
+            errors.append(f"Error processing tag {row[0]}/{row[1]}: {str(e)}")
+    conn.execute("RELEASE oracle_sync_batch")
+    return failed, errors
+
+
+def _stream_tags_page(
+    db: SQLiteManager,
+    count_sql: str,
+    select_sql: str,
+    params: list,
+    select_params: list,
+    pagination: PaginationParams,
+    first_page: bool,
+    cached_total: Optional[int],
+    total_key: tuple,
+    generation: int
+) -> Iterator[bytes]:
+    """
+    Yield a CursorPaginatedResponse[TagResponse] JSON body in chunks
+
+    The connection stays open while the page is sent; rows are encoded with
+    orjson in batches of _STREAM_BATCH_ROWS. The total count comes from the
+    first batch (or the totals cache), so the page is read with a single query.
+    next_cursor is written after the items, once the last row is known.
+    """
+    sent = 0
+    last_id = None
+    with db.get_connection(read_only=True) as conn:
+        cursor = conn.execute(select_sql, select_params)
+        cursor.arraysize = _STREAM_BATCH_ROWS
+        batches = _iter_row_batches(cursor)
+        rows = next(batches, [])
+
+        if cached_total is None:
+            total_count = _page_total(conn, rows, count_sql, params, first_page)
+            _store_list_total(total_key, generation, total_count)
+        else:
+            total_count = cached_total
+        metadata = pagination.get_pagination_metadata(total_count)
+        yield orjson.dumps(metadata)[:-1] + b',"items":['
+
+        while rows:
+            body = b",".join(orjson.dumps(_row_to_tag_fields(row)) for row in rows)
+            yield body if not sent else b"," + body
+            sent += len(rows)
+            last_id = rows[-1]['id']
+            rows = next(batches, [])
+
+    next_cursor = last_id if sent == pagination.limit else None
+    yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+
+
+def _iter_row_batches(cursor: sqlite3.Cursor) -> Iterator[List[sqlite3.Row]]:
+    """Yield cursor rows in batches of cursor.arraysize (at most one batch held in memory)"""
+    while True:
+        batch = cursor.fetchmany()
+        if not batch:
+            return
+        yield batch
+
+
+def invalidate_tag_caches() -> None:
+    """
+    Retire cached tag categories and list totals
+
+    Call after any committed write to the tags table, including from other
+    routers (e.g. polling group tag assignment).
+    """
+    global _tags_generation
+    with _tags_generation_lock:
+        _tags_generation += 1
+
+
+def _fetch_tag_row(conn: sqlite3.Connection, tag_id: int) -> Optional[sqlite3.Row]:
+    """Fetch one tags row on an already-open connection (None if not found)"""
+    return conn.execute(_SQL_SELECT_TAG, (tag_id,)).fetchone()
+
+
+def _row_to_tag_fields(row: sqlite3.Row) -> dict:
+    """Map a tags row to TagResponse field values"""
+    created_at = row['created_at']
+    updated_at = row['updated_at']
+    # Timestamps are normally set; only fall back to now() for legacy rows without them
+    if not (created_at and updated_at):
+        now = datetime.now().isoformat()
+        created_at = created_at or now
+        updated_at = updated_at or now
+    return {
+        "id": row['id'],
+        "plc_code": row['plc_code'] or '',
+        "machine_code": row['machine_code'] or '',
+        "tag_address": row['tag_address'],
+        "tag_name": row['tag_name'],
+        "tag_division": row['description'] or '',
+        "tag_category": row['tag_category'] or None,
+        "data_type": row['tag_type'],
+        "unit": str(row['unit']) if row['unit'] else None,
+        "scale": float(row['scale']) if row['scale'] is not None else 1.0,
+        "polling_group_id": row['polling_group_id'],
+        "log_mode": row['log_mode'] or 'ALWAYS',
+        "enabled": bool(row['is_active']),
+        "created_at": created_at,
+        "updated_at": updated_at,
+    }
+
+
+def _row_to_tag_response(row: sqlite3.Row) -> TagResponse:
+    """
+    Convert database row to TagResponse
+
+    Columns are read by name and the model is built with model_construct()
+    (DB rows are trusted, so per-field validation is skipped).
+    """
+    return TagResponse.model_construct(**_row_to_tag_fields(row))
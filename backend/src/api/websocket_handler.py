@@ -5,10 +5,12 @@ Real-time updates for polling engine status via WebSocket.
 """
 
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Set, Optional
+from typing import Set, Optional, Tuple
 import asyncio
 import json
 import logging
+import orjson
+import time
 from datetime import datetime
 
 from src.polling.polling_engine import PollingEngine
@@ -16,6 +18,11 @@ from src.polling.polling_engine import PollingEngine
 logger = logging.getLogger(__name__)
 
 
+def _encode(message) -> str:
+    """Encode a message for send_text with orjson (faster than send_json's stdlib json)"""
+    return orjson.dumps(message).decode()
+
+
 class ConnectionManager:
     """
     WebSocket connection manager
@@ -23,11 +30,22 @@ class ConnectionManager:
     Manages active WebSocket connections and broadcasts status updates.
     """
 
+    # Engine status is reused for this long by broadcasts and per-client sends,
+    # so many clients connecting or asking at once cost one engine query
+    STATUS_REUSE_S = 0.05
+    # Status with at least this many polling groups (~50 KB of JSON) is encoded
+    # in the default thread pool so it doesn't block other sends on the event loop
+    ENCODE_OFFLOAD_MIN_GROUPS = 150
+
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
         self.broadcast_task: Optional[asyncio.Task] = None
         self.engine: Optional[PollingEngine] = None
         self.broadcast_interval_s = 1.0  # Broadcast every 1 second
+        # Last broadcast status, encoded without its timestamp (skip unchanged broadcasts)
+        self._last_status: Optional[str] = None
+        # (computed_at, JSON encoding of the engine status without timestamp)
+        self._status_cache: Optional[Tuple[float, str]] = None
 
     def set_engine(self, engine: PollingEngine):
         """Set the polling engine instance"""
@@ -50,29 +68,49 @@ class ConnectionManager:
         if not self.active_connections and self.broadcast_task:
             self.broadcast_task.cancel()
 
+    async def _encode_status(self, message: dict, group_count: int) -> str:
+        """Encode a status payload, off the event loop when it is large"""
+        if group_count < self.ENCODE_OFFLOAD_MIN_GROUPS:
+            return _encode(message)
+        return await asyncio.get_running_loop().run_in_executor(None, _encode, message)
+
+    async def _current_status(self) -> str:
+        """JSON encoding of the engine status (groups + queue), reused for STATUS_REUSE_S"""
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and now - cached[0] < self.STATUS_REUSE_S:
+            return cached[1]
+
+        status = {
+            "groups": self.engine.get_status_all(),
+            "queue": {
+                "queue_size": self.engine.get_queue_size(),
+                "queue_maxsize": self.engine.data_queue.maxsize,
+                "queue_is_full": self.engine.data_queue.is_full()
+            }
+        }
+        encoded = await self._encode_status(status, len(status["groups"]))
+        self._status_cache = (now, encoded)
+        return encoded
+
+    @staticmethod
+    def _status_message(encoded_status: str) -> str:
+        """
+        Wrap encoded engine status as a status_update message stamped with the current time
+
+        The timestamp is spliced into the already-encoded status object (before its
+        closing brace), so the status is only encoded once per change.
+        """
+        timestamp = _encode(datetime.now().isoformat())
+        return f'{{"type":"status_update","data":{encoded_status[:-1]},"timestamp":{timestamp}}}}}'
+
     async def send_status(self, websocket: WebSocket):
         """Send current engine status to a single connection"""
         if not self.engine:
             return
 
         try:
-            groups_status = self.engine.get_status_all()
-            queue_size = self.engine.get_queue_size()
-
-            status_data = {
-                "type": "status_update",
-                "data": {
-                    "groups": groups_status,
-                    "queue": {
-                        "queue_size": queue_size,
-                        "queue_maxsize": self.engine.data_queue.maxsize,
-                        "queue_is_full": self.engine.data_queue.is_full()
-                    },
-                    "timestamp": datetime.now().isoformat()
-                }
-            }
-
-            await websocket.send_json(status_data)
+            await websocket.send_text(self._status_message(await self._current_status()))
         except Exception as e:
             logger.error(f"Error sending status to WebSocket: {e}")
 
@@ -86,39 +124,41 @@ class ConnectionManager:
             return
 
         try:
-            groups_status = self.engine.get_status_all()
-            queue_size = self.engine.get_queue_size()
-
-            status_data = {
-                "type": "status_update",
-                "data": {
-                    "groups": groups_status,
-                    "queue": {
-                        "queue_size": queue_size,
-                        "queue_maxsize": self.engine.data_queue.maxsize,
-                        "queue_is_full": self.engine.data_queue.is_full()
-                    },
-                    "timestamp": datetime.now().isoformat()
-                }
-            }
-
-            # Send to all connections
-            dead_connections = set()
-            for connection in self.active_connections:
-                try:
-                    await connection.send_json(status_data)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to WebSocket: {e}")
-                    dead_connections.add(connection)
-
-            # Remove dead connections
-            self.active_connections -= dead_connections
+            encoded_status = await self._current_status()
+
+            # Nothing changed since the last broadcast: send nothing.
+            # (Newly connected clients get the current status from send_status.)
+            if encoded_status == self._last_status:
+                return
+            self._last_status = encoded_status
+
+            # Same text frame for every client
+            payload = self._status_message(encoded_status)
+
+            # Snapshot: clients may connect/disconnect while the sends are awaited
+            connections = tuple(self.active_connections)
+            results = await asyncio.gather(
+                *(connection.send_text(payload) for connection in connections),
+                return_exceptions=True
+            )
+
+            # Remove dead connections (the list is only built when a send failed)
+            dead_connections = None
+            for connection, result in zip(connections, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error broadcasting to WebSocket: {result}")
+                    if dead_connections is None:
+                        dead_connections = []
+                    dead_connections.append(connection)
+            if dead_connections:
+                self.active_connections.difference_update(dead_connections)
 
         except Exception as e:
             logger.error(f"Error broadcasting status: {e}")
 
     async def _broadcast_loop(self):
-        """Background task to periodically broadcast status"""
+        """Background task to periodically broadcast status (only when it changed)"""
+        self._last_status = None
         try:
             while self.active_connections:
                 await self.broadcast_status()
@@ -157,37 +197,21 @@ async def websocket_endpoint(websocket: WebSocket):
             logger.error(f"Failed to send initial status: {e}", exc_info=True)
             return
 
-        # Keep connection alive and handle messages
+        # Handle client messages. Keepalive is left to the server's protocol-level
+        # PING frames (uvicorn ws_ping_interval / ws_ping_timeout), so there is no
+        # receive timeout here; a dead peer surfaces as WebSocketDisconnect.
         while True:
+            data = await websocket.receive_text()
+
             try:
-                # Wait for messages from client (heartbeat, commands, etc.)
-                # Longer timeout to prevent unnecessary disconnections
-                data = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=120.0  # 120 second timeout (2 minutes)
-                )
-
-                # Handle client messages
-                try:
-                    message = json.loads(data)
-                    if message.get("type") == "ping":
-                        await websocket.send_json({"type": "pong"})
-                    elif message.get("type") == "pong":
-                        # Client responded to our ping, connection is alive
-                        pass
-                    elif message.get("type") == "get_status":
-                        await manager.send_status(websocket)
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON received: {data}")
-
-            except asyncio.TimeoutError:
-                # No message received in 120 seconds, send ping to check if client is alive
-                try:
-                    await websocket.send_json({"type": "ping"})
-                    logger.debug("Sent ping to client after timeout")
-                except Exception as e:
-                    logger.error(f"Failed to send ping: {e}")
-                    break
+                message = json.loads(data)
+                if message.get("type") == "ping":
+                    # App-level heartbeat from the admin client
+                    await websocket.send_text(_encode({"type": "pong"}))
+                elif message.get("type") == "get_status":
+                    await manager.send_status(websocket)
+            except json.JSONDecodeError:
+                logger.warning(f"Invalid JSON received: {data}")
 
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected normally")
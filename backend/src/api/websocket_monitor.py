@@ -6,18 +6,42 @@ Broadcasts equipment status to connected Monitor UI clients every 1 second
 """
 
 import asyncio
-import json
 import logging
+import random
+import orjson
 from datetime import datetime
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 from fastapi import WebSocket, WebSocketDisconnect
 
+from src.config.settings import settings
 
 # Connected Monitor UI clients
 active_connections: Set[WebSocket] = set()
 
 logger = logging.getLogger(__name__)
 
+
+def _encode(message) -> str:
+    """Encode a message for send_text with orjson (faster than send_json's stdlib json)"""
+    return orjson.dumps(message).decode()
+
+
+# Mock equipment (code, name) pairs, built once; only the status fields change per tick
+_MOCK_EQUIPMENT = (
+    ("KRCWO12ELOA101", "Upper 로봇 용접"), ("KRCWO12ELOA102", "Lower 로봇 용접"),
+    ("KRCWO12ELOA103", "Front 조립"), ("KRCWO12ELOA104", "Rear 조립"),
+    ("KRCWO12ELOA105", "Paint 도장"), ("KRCWO12ELOA106", "Inspection 검사"),
+    ("KRCWO12ELOA107", "Welding 1"), ("KRCWO12ELOA108", "Welding 2"),
+    ("KRCWO12ELOA109", "Assembly 1"), ("KRCWO12ELOA110", "Assembly 2"),
+    ("KRCWO12ELOA111", "Coating 1"), ("KRCWO12ELOA112", "Coating 2"),
+    ("KRCWO12ELOA113", "Quality 1"), ("KRCWO12ELOA114", "Quality 2"),
+    ("KRCWO12ELOA115", "Packing 1"), ("KRCWO12ELOA116", "Packing 2"),
+    ("KRCWO12ELOA117", "Shipping"),
+)
+
+# Shared broadcast task: one status build per tick for all clients
+_broadcast_task: Optional[asyncio.Task] = None
+
 # Polling engine instance (to be set by main.py)
 _polling_engine = None
 
@@ -57,50 +81,76 @@ async def websocket_monitor_endpoint(websocket: WebSocket):
 
     try:
         # Send connection status message
-        await websocket.send_json({
+        await websocket.send_text(_encode({
             "type": "connection_status",
             "timestamp": datetime.now().isoformat(),
             "status": "connected",
             "message": "WebSocket connected successfully"
-        })
-
-        # Continuous broadcast loop
-        while True:
-            try:
-                # Get equipment status from polling engine
-                equipment_status = await get_equipment_status()
+        }))
 
-                # Broadcast to client
-                message = {
-                    "type": "equipment_status",
-                    "timestamp": datetime.now().isoformat(),
-                    "equipment": equipment_status
-                }
+        # Current status right away; later updates come from the shared broadcast task
+        await websocket.send_text(_encode(_equipment_message(await get_equipment_status())))
+        _ensure_broadcast_task()
 
-                await websocket.send_json(message)
-
-                # Wait 1 second before next broadcast
-                await asyncio.sleep(1)
-
-            except WebSocketDisconnect:
-                break
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
+        # Wait for the client to go away (incoming messages are ignored)
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
                 break
 
     except WebSocketDisconnect:
         pass
+    except Exception as e:
+        logger.error(f"Error serving monitor client: {e}")
     finally:
         active_connections.discard(websocket)
         logger.info(f"Monitor client disconnected. Active connections: {len(active_connections)}")
 
 
+def _equipment_message(equipment_status: List[Dict]) -> Dict:
+    """Wrap equipment status as an equipment_status message stamped with the current time"""
+    return {
+        "type": "equipment_status",
+        "timestamp": datetime.now().isoformat(),
+        "equipment": equipment_status
+    }
+
+
+def _ensure_broadcast_task() -> None:
+    """Start the shared broadcast task if it is not running"""
+    global _broadcast_task
+    if _broadcast_task is None or _broadcast_task.done():
+        _broadcast_task = asyncio.create_task(_broadcast_loop())
+
+
+async def _broadcast_loop():
+    """
+    Build the equipment status once per second and send it to every client
+
+    Runs while any Monitor UI client is connected; the next connection restarts it.
+    """
+    try:
+        while active_connections:
+            # Clients get their first status on connect, so wait before each tick
+            await asyncio.sleep(1)
+            if active_connections:
+                await broadcast_to_all_clients(_equipment_message(await get_equipment_status()))
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        logger.error(f"Monitor broadcast loop failed: {e}")
+
+
 async def get_equipment_status() -> List[Dict]:
     """
     Get current equipment status from polling engine
 
     Returns list of equipment status dictionaries
     """
+    # MONITOR_MOCK=0 (.env): no mock data until the polling engine query is implemented
+    if not settings.MONITOR_MOCK:
+        return []
+
     if _polling_engine is None:
         # Return mock data if polling engine is not available
         return get_mock_equipment_status()
@@ -124,33 +174,17 @@ def get_mock_equipment_status() -> List[Dict]:
 
     This is temporary until actual polling engine integration is implemented
     """
-    # 17 equipment mock data
-    equipment_codes = [
-        "KRCWO12ELOA101", "KRCWO12ELOA102", "KRCWO12ELOA103",
-        "KRCWO12ELOA104", "KRCWO12ELOA105", "KRCWO12ELOA106",
-        "KRCWO12ELOA107", "KRCWO12ELOA108", "KRCWO12ELOA109",
-        "KRCWO12ELOA110", "KRCWO12ELOA111", "KRCWO12ELOA112",
-        "KRCWO12ELOA113", "KRCWO12ELOA114", "KRCWO12ELOA115",
-        "KRCWO12ELOA116", "KRCWO12ELOA117"
-    ]
-
-    equipment_names = [
-        "Upper 로봇 용접", "Lower 로봇 용접", "Front 조립",
-        "Rear 조립", "Paint 도장", "Inspection 검사",
-        "Welding 1", "Welding 2", "Assembly 1",
-        "Assembly 2", "Coating 1", "Coating 2",
-        "Quality 1", "Quality 2", "Packing 1",
-        "Packing 2", "Shipping"
-    ]
-
     equipment_status_list = []
+    # One timestamp for the whole snapshot
+    now_iso = datetime.now().isoformat()
+    # Bound locals: the random helpers are called several times per equipment
+    choice = random.choice
+    rand = random.random
 
-    import random
-
-    for i, (code, name) in enumerate(zip(equipment_codes, equipment_names)):
+    for code, name in _MOCK_EQUIPMENT:
         # Randomly generate status for testing
-        connection = random.choice([True, True, True, False])  # 75% connected
-        error_tag = 0 if connection else random.choice([0, 0, 0, 1])  # 25% error when connected
+        connection = choice([True, True, True, False])  # 75% connected
+        error_tag = 0 if connection else choice([0, 0, 0, 1])  # 25% error when connected
         status_tag = 1 if connection and error_tag == 0 else 0
 
         if not connection:
@@ -159,7 +193,7 @@ def get_mock_equipment_status() -> List[Dict]:
             status = "error"
         elif status_tag == 0:
             status = "stopped"
-        elif random.random() < 0.2:
+        elif rand() < 0.2:
             status = "idle"
         else:
             status = "running"
@@ -173,7 +207,7 @@ def get_mock_equipment_status() -> List[Dict]:
                 "error_tag": error_tag,
                 "connection": connection
             },
-            "last_updated": datetime.now().isoformat()
+            "last_updated": now_iso
         })
 
     return equipment_status_list
@@ -188,13 +222,18 @@ async def broadcast_to_all_clients(message: Dict):
     if not active_connections:
         return
 
-    disconnected = set()
+    # Encode once and send the same text frame to every client
+    payload = _encode(message)
 
-    for websocket in active_connections:
-        try:
-            await websocket.send_json(message)
-        except Exception:
-            disconnected.add(websocket)
+    # Snapshot: clients may connect/disconnect while the sends are awaited
+    connections = tuple(active_connections)
+    results = await asyncio.gather(
+        *(websocket.send_text(payload) for websocket in connections),
+        return_exceptions=True
+    )
 
     # Remove disconnected clients
-    active_connections.difference_update(disconnected)
+    active_connections.difference_update(
+        websocket for websocket, result in zip(connections, results)
+        if isinstance(result, Exception)
+    )
@@ -5,6 +5,7 @@ Feature 5: Database Management REST API
 Provides CRUD operations for production workstages
 """
 
+import sqlite3
 from typing import List
 from fastapi import APIRouter, Depends, status, HTTPException
 from src.database.sqlite_manager import SQLiteManager
@@ -16,30 +17,64 @@ from src.database.validators import (
     validate_workstage_code_unique,
     validate_workstage_code
 )
+from src.oracle_writer.config import load_cached_config
+from src.oracle_writer.oracle_helper import get_oracle_workstages
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/workstages", tags=["workstages"])
 
+# INSERT/UPDATE ... RETURNING requires SQLite 3.35+
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_SQL_SELECT_WORKSTAGE = "SELECT * FROM workstages WHERE id = ?"
+_SQL_INSERT_WORKSTAGE = """
+    INSERT INTO workstages (
+        machine_code, sequence_order, workstage_code, workstage_name,
+        description, is_active
+    )
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_WORKSTAGE_RETURNING = _SQL_INSERT_WORKSTAGE + " RETURNING *"
+
+# Oracle workstage sync: one UPSERT per workstage on the UNIQUE workstage_code key;
+# created/updated counts come from the row count before and after
+_SQL_SYNC_COUNT_WORKSTAGES = "SELECT COUNT(*) FROM workstages"
+_SQL_SYNC_UPSERT_WORKSTAGE = """
+    INSERT INTO workstages
+    (workstage_code, workstage_name, description, sequence_order, is_active)
+    VALUES (?, ?, ?, ?, 1)
+    ON CONFLICT(workstage_code) DO UPDATE SET
+        workstage_name = excluded.workstage_name,
+        description = excluded.description,
+        sequence_order = excluded.sequence_order,
+        is_active = 1,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
 
 # ==============================================================================
 # Helper function to convert database row to WorkstageResponse
 # ==============================================================================
 
-def _row_to_workstage_response(row):
+def _row_to_workstage_response(row) -> WorkstageResponse:
     """
     Convert workstages table row to WorkstageResponse
 
-    Row format: (id, workstage_code, workstage_name, description, sequence_order, is_active, created_at, updated_at)
+    Columns are read by name and the model is built with model_construct()
+    (DB rows are trusted, so per-field validation is skipped).
     """
-    return WorkstageResponse(
-        id=row[0],
+    return WorkstageResponse.model_construct(
+        id=row['id'],
         machine_code=None,
-        workstage_sequence=row[4],  # sequence_order
-        workstage_code=row[1],
-        workstage_name=row[2],
-        equipment_type=row[3],  # description
-        enabled=bool(row[5]),  # is_active
-        created_at=row[6],
-        updated_at=row[7]
+        workstage_sequence=row['sequence_order'],
+        workstage_code=row['workstage_code'],
+        workstage_name=row['workstage_name'],
+        equipment_type=row['description'],
+        enabled=bool(row['is_active']),
+        created_at=row['created_at'],
+        updated_at=row['updated_at']
     )
 
 
@@ -71,33 +106,26 @@ def create_workstage(workstage: WorkstageCreate, db: SQLiteManager = Depends(get
     # Validate unique workstage_code
     validate_workstage_code_unique(db, workstage.workstage_code)
 
+    insert_params = (
+        workstage.machine_code,
+        workstage.workstage_sequence,
+        workstage.workstage_code,
+        workstage.workstage_name,
+        workstage.equipment_type,
+        workstage.enabled
+    )
+
     with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO workstages (
-                machine_code, sequence_order, workstage_code, workstage_name,
-                description, is_active
-            )
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            workstage.machine_code,
-            workstage.workstage_sequence,
-            workstage.workstage_code,
-            workstage.workstage_name,
-            workstage.equipment_type,
-            workstage.enabled
-        ))
+        # Read the created row back in the same statement when SQLite supports it
+        if _SQLITE_HAS_RETURNING:
+            row = conn.execute(_SQL_INSERT_WORKSTAGE_RETURNING, insert_params).fetchone()
+        else:
+            cursor = conn.execute(_SQL_INSERT_WORKSTAGE, insert_params)
+            row = conn.execute(_SQL_SELECT_WORKSTAGE, (cursor.lastrowid,)).fetchone()
         conn.commit()
-        workstage_id = cursor.lastrowid
 
     # Log operation
-    log_crud_operation("CREATE", "Workstage", workstage_id, success=True)
-
-    # Fetch created workstage
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM workstages WHERE id = ?", (workstage_id,))
-        row = cursor.fetchone()
+    log_crud_operation("CREATE", "Workstage", row['id'], success=True)
 
     return _row_to_workstage_response(row)
 
@@ -119,22 +147,26 @@ def list_workstages(
 
     Returns paginated list of workstages
     """
-    # Get total count
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM workstages")
-        total_count = cursor.fetchone()[0]
-
-    # Get paginated workstages
-    with db.get_connection() as conn:
+    # Page rows and total count in one statement; the uncorrelated COUNT subquery is
+    # evaluated once (COUNT(*) OVER () would materialize every row before LIMIT)
+    with db.get_connection(read_only=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
-            SELECT * FROM workstages
-            ORDER BY sequence_order, workstage_code
+            SELECT w.*, (SELECT COUNT(*) FROM workstages) AS _total
+            FROM workstages w
+            ORDER BY w.sequence_order, w.workstage_code
             LIMIT ? OFFSET ?
         """, (pagination.limit, pagination.skip))
         rows = cursor.fetchall()
 
+        if rows:
+            total_count = rows[0]['_total']
+        elif pagination.skip:
+            # Past the last page: no row carries the total
+            total_count = cursor.execute("SELECT COUNT(*) FROM workstages").fetchone()[0]
+        else:
+            total_count = 0
+
     workstages = [_row_to_workstage_response(row) for row in rows]
 
     metadata = pagination.get_pagination_metadata(total_count)
@@ -160,7 +192,7 @@ def get_workstage(workstage_id: int, db: SQLiteManager = Depends(get_db)):
     """
     with db.get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM workstages WHERE id = ?", (workstage_id,))
+        cursor.execute(_SQL_SELECT_WORKSTAGE, (workstage_id,))
         row = cursor.fetchone()
 
     if not row:
@@ -192,13 +224,6 @@ def update_workstage(
 
     Returns updated workstage
     """
-    # Check workstage exists
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM workstages WHERE id = ?", (workstage_id,))
-        if not cursor.fetchone():
-            raise_not_found("Workstage", workstage_id)
-
     # Build update query
     updates = []
     params = []
@@ -227,17 +252,26 @@ def update_workstage(
     updates.append("updated_at = CURRENT_TIMESTAMP")
     params.append(workstage_id)
 
+    # One connection: UPDATE ... RETURNING (a missing workstage returns no row)
     with db.get_connection() as conn:
-        cursor = conn.cursor()
         query = f"UPDATE workstages SET {', '.join(updates)} WHERE id = ?"
-        cursor.execute(query, params)
+        # Read the updated row back in the same statement when SQLite supports it
+        if _SQLITE_HAS_RETURNING:
+            row = conn.execute(query + " RETURNING *", params).fetchone()
+        elif conn.execute(query, params).rowcount:
+            row = conn.execute(_SQL_SELECT_WORKSTAGE, (workstage_id,)).fetchone()
+        else:
+            row = None
         conn.commit()
 
+    if row is None:
+        raise_not_found("Workstage", workstage_id)
+
     # Log operation
     log_crud_operation("UPDATE", "Workstage", workstage_id, success=True)
 
     # Return updated workstage
-    return get_workstage(workstage_id, db)
+    return _row_to_workstage_response(row)
 
 
 # ==============================================================================
@@ -284,15 +318,8 @@ def get_oracle_connection_info():
     Returns connection details for Oracle sync confirmation dialog
     """
     try:
-        from src.oracle_writer.config import load_config_from_env
-        from src.config.logging_config import get_logger
-
-        logger = get_logger(__name__)
-        config = load_config_from_env()
-        return config.to_dict()
+        return load_cached_config().to_dict()
     except Exception as e:
-        from src.config.logging_config import get_logger
-        logger = get_logger(__name__)
         logger.error(f"Failed to load Oracle config: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -309,7 +336,7 @@ def sync_workstages_from_oracle(db: SQLiteManager = Depends(get_db)):
 
     This endpoint:
     1. Fetches all active workstages (USE_YN='Y') from Oracle ICOM_WORKSTAGE_MASTER
-    2. For each Oracle workstage:
+    2. Upserts every Oracle workstage in one batch (one transaction):
        - If workstage_code exists in SQLite: UPDATE the workstage
        - If workstage_code doesn't exist: INSERT new workstage
     3. Returns sync statistics
@@ -325,11 +352,6 @@ def sync_workstages_from_oracle(db: SQLiteManager = Depends(get_db)):
             "error_details": []
         }
     """
-    from src.oracle_writer.oracle_helper import get_oracle_workstages
-    from src.config.logging_config import get_logger
-
-    logger = get_logger(__name__)
-
     try:
         # Fetch workstages from Oracle
         logger.info("Starting Oracle workstage synchronization...")
@@ -342,53 +364,44 @@ def sync_workstages_from_oracle(db: SQLiteManager = Depends(get_db)):
         error_count = 0
         error_details = []
 
+        # New workstages are inserted without machine_code (set later)
+        upserts = [
+            (
+                oracle_workstage['workstage_code'],
+                oracle_workstage['workstage_name'],
+                oracle_workstage.get('description', ''),
+                oracle_workstage.get('sequence_order', 0),
+            )
+            for oracle_workstage in oracle_workstages
+        ]
+
         with db.get_connection() as conn:
-            cursor = conn.cursor()
-
-            for oracle_workstage in oracle_workstages:
-                workstage_code = oracle_workstage['workstage_code']
-                workstage_name = oracle_workstage['workstage_name']
-                description = oracle_workstage.get('description', '')
-                sequence_order = oracle_workstage.get('sequence_order', 0)
-
-                try:
-                    # Check if workstage exists in SQLite
-                    cursor.execute(
-                        "SELECT id FROM workstages WHERE workstage_code = ?",
-                        (workstage_code,)
-                    )
-                    existing = cursor.fetchone()
-
-                    if existing:
-                        # UPDATE existing workstage
-                        cursor.execute("""
-                            UPDATE workstages
-                            SET workstage_name = ?,
-                                description = ?,
-                                sequence_order = ?,
-                                is_active = 1,
-                                updated_at = CURRENT_TIMESTAMP
-                            WHERE workstage_code = ?
-                        """, (workstage_name, description, sequence_order, workstage_code))
-                        updated_count += 1
-                        logger.debug(f"Updated workstage: {workstage_code}")
-
-                    else:
-                        # INSERT new workstage (without machine_code and plc_id - will be set later)
-                        cursor.execute("""
-                            INSERT INTO workstages
-                            (workstage_code, workstage_name, description, sequence_order, is_active)
-                            VALUES (?, ?, ?, ?, 1)
-                        """, (workstage_code, workstage_name, description, sequence_order))
-                        created_count += 1
-                        logger.debug(f"Created workstage: {workstage_code}")
-
-                except Exception as e:
-                    error_count += 1
-                    error_msg = f"Error processing {workstage_code}: {str(e)}"
-                    error_details.append(error_msg)
-                    logger.error(error_msg)
-                    continue
+            # Take the write lock up front so the before/after row counts stay valid
+            conn.execute("BEGIN IMMEDIATE")
+            count_before = conn.execute(_SQL_SYNC_COUNT_WORKSTAGES).fetchone()[0]
+
+            # Insert new workstages and update existing ones in one executemany;
+            # if the batch fails, replay it row by row so only the bad rows are reported
+            failed_count = 0
+            conn.execute("SAVEPOINT workstage_sync")
+            try:
+                conn.executemany(_SQL_SYNC_UPSERT_WORKSTAGE, upserts)
+            except sqlite3.Error:
+                conn.execute("ROLLBACK TO workstage_sync")
+                for row in upserts:
+                    try:
+                        conn.execute(_SQL_SYNC_UPSERT_WORKSTAGE, row)
+                    except sqlite3.Error as e:
+                        failed_count += 1
+                        error_msg = f"Error processing {row[0]}: {str(e)}"
+                        error_details.append(error_msg)
+                        logger.error(error_msg)
+            conn.execute("RELEASE workstage_sync")
+            error_count += failed_count
+
+            # Rows that did not add a workstage updated one (repeats in the feed count as updates)
+            created_count = conn.execute(_SQL_SYNC_COUNT_WORKSTAGES).fetchone()[0] - count_before
+            updated_count = len(upserts) - failed_count - created_count
 
             # Commit all changes
             conn.commit()
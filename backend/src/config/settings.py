@@ -176,6 +176,12 @@ class Settings:
         """WebSocket 브로드캐스트 간격 (초)"""
         return float(os.getenv("WEBSOCKET_BROADCAST_INTERVAL", "1.0"))
 
+    @property
+    def MONITOR_MOCK(self) -> bool:
+        """Monitor UI 가상(mock) 설비 상태 사용 여부 (false면 설비 목록을 비워서 전송)"""
+        value = os.getenv("MONITOR_MOCK", "true").lower()
+        return value in ("true", "1", "yes", "on")
+
     # =========================================================================
     # Buffer Configuration
     # =========================================================================
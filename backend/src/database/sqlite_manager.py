@@ -3,33 +3,273 @@ SQLite Database Manager for JSScada.
 Handles connection, queries, and database operations.
 """
 import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Set
 from contextlib import contextmanager
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Indexes applied once per database file at SQLiteManager init: (table, DDL)
+# Tables that do not exist in the current schema are skipped.
+_INDEX_MIGRATIONS: Tuple[Tuple[str, str], ...] = (
+    # list_tags filters (plc_code / machine_code / polling_group_id / tag_category /
+    # is_active), newest first. One (column, id DESC) index per filter: the planner
+    # seeks the most selective filter column, reads in id order (no sort step for
+    # ORDER BY id DESC, keyset "id < ?" is part of the seek) and checks the rest per row.
+    # Checked with EXPLAIN QUERY PLAN for every filter combination; composite
+    # indexes over several filter columns were never needed to avoid a sort.
+    ("tags",
+     "CREATE INDEX IF NOT EXISTS idx_tags_plc_code ON tags(plc_code, id DESC)"),
+    # Also polling group tag loading (polling_group_id = ? AND is_active = 1)
+    ("tags",
+     "CREATE INDEX IF NOT EXISTS idx_tags_polling_group_id ON tags(polling_group_id, id DESC)"),
+    ("tags",
+     "CREATE INDEX IF NOT EXISTS idx_tags_machine_code ON tags(machine_code, id DESC)"),
+    # Also the DISTINCT tag_category list for the filter dropdown
+    ("tags",
+     "CREATE INDEX IF NOT EXISTS idx_tags_tag_category ON tags(tag_category, id DESC)"),
+    ("tags",
+     "CREATE INDEX IF NOT EXISTS idx_tags_active_id ON tags(is_active, id DESC)"),
+)
+
+
+# PRAGMAs applied to every connection when it is opened.
+# WAL lets readers run alongside a writer; with WAL, synchronous=NORMAL is crash-safe.
+_CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",  # ~20 MiB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys = ON",
+    # ANALYZE / PRAGMA optimize sample at most ~400 rows per index (bounded cost on large tables)
+    "PRAGMA analysis_limit=400",
+)
+
+
+def _open_connection(
+    db_path: Path,
+    statement_cache_size: int,
+    check_same_thread: bool = True
+) -> sqlite3.Connection:
+    """
+    SQLite 연결 생성 (Row factory, PRAGMA 설정 포함)
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+        statement_cache_size: 연결당 prepared statement 캐시 크기
+        check_same_thread: False면 다른 스레드에서도 사용 가능 (풀 연결)
+    """
+    conn = sqlite3.connect(
+        str(db_path),
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        cached_statements=statement_cache_size,
+        check_same_thread=check_same_thread
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _optimize(conn: sqlite3.Connection) -> None:
+    """
+    PRAGMA optimize로 플래너 통계 갱신 (실패해도 무시)
+
+    optimize는 대량 쓰기 등으로 통계가 오래된 인덱스만 다시 분석하므로
+    대부분 즉시 끝납니다.
+    """
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error as e:
+        logger.debug(f"PRAGMA optimize skipped: {e}")
+
+
+class ConnectionPool:
+    """
+    스레드 안전한 SQLite 연결 풀
+
+    유휴 연결을 최대 pool_size개까지 보관하고 재사용합니다. 유휴 연결이 없으면
+    새 연결을 만들므로 acquire()는 블로킹하지 않습니다 (중첩 사용 시 교착 없음).
+    반환 시 커밋되지 않은 트랜잭션은 롤백됩니다.
+    read_only 풀의 연결은 생성 시 PRAGMA query_only=1이 한 번만 설정됩니다.
+
+    쓰기 풀은 OPTIMIZE_INTERVAL번 반환될 때마다, 그리고 close_all() (종료 시)에서
+    PRAGMA optimize를 한 번 실행합니다. 풀 연결은 거의 닫히지 않으므로 닫을 때마다
+    실행하는 방식으로는 장시간 실행 중 통계가 갱신되지 않고, 반환마다 실행하기에는
+    요청당 비용이 큽니다.
+    """
+
+    # 쓰기 풀에서 PRAGMA optimize를 실행하는 반환 간격
+    OPTIMIZE_INTERVAL = 1000
+
+    def __init__(
+        self,
+        db_path: Path,
+        pool_size: int,
+        statement_cache_size: int,
+        read_only: bool = False
+    ):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self.statement_cache_size = statement_cache_size
+        self.read_only = read_only
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._releases = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # 한 번에 한 스레드만 사용 (acquire/release로 보장)
+        conn = _open_connection(self.db_path, self.statement_cache_size, check_same_thread=False)
+        if self.read_only:
+            conn.execute("PRAGMA query_only=1")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """유휴 연결을 꺼내거나, 없으면 새로 연결"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """연결 반환 (유휴 연결이 가득 차 있거나 상태가 불량하면 닫음)"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+
+        optimize = False
+        if not self.read_only:
+            with self._lock:
+                self._releases += 1
+                if self._releases >= self.OPTIMIZE_INTERVAL:
+                    self._releases = 0
+                    optimize = True
+        if optimize:
+            _optimize(conn)
+
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def warm(self) -> int:
+        """유휴 연결을 pool_size개까지 미리 생성 (PRAGMA 적용된 연결을 첫 요청 전에 준비)"""
+        with self._lock:
+            missing = self.pool_size - len(self._idle)
+        for _ in range(missing):
+            self.release(self._connect())
+        return max(missing, 0)
+
+    def close_all(self) -> None:
+        """유휴 연결 모두 닫기 (쓰기 풀은 먼저 PRAGMA optimize 한 번 실행)"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        if idle and not self.read_only:
+            _optimize(idle[0])
+        for conn in idle:
+            conn.close()
+
 
 class SQLiteManager:
     """SQLite 데이터베이스 연결 및 쿼리 관리"""
 
-    def __init__(self, db_path: str):
+    # 연결당 prepared statement 캐시 크기 (sqlite3 기본값 128)
+    STATEMENT_CACHE_SIZE = 256
+
+    # 인덱스 마이그레이션이 적용된 DB 경로 (프로세스당 1회만 실행)
+    _migrated_paths: Set[str] = set()
+
+    # (DB 경로, read_only)별 공유 연결 풀 (요청마다 생성되는 SQLiteManager 인스턴스 간 공유)
+    # 조회 전용 연결과 쓰기 연결을 분리해 보관하므로 체크아웃마다 query_only를 토글하지 않음
+    _pools: Dict[Tuple[str, bool], ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, db_path: str, pool_size: int = 0):
         """
         SQLite 데이터베이스 매니저 초기화
 
         Args:
             db_path: 데이터베이스 파일 경로
+            pool_size: 유휴 연결 풀 크기 (0이면 호출마다 새 연결; 마이그레이션 스크립트 등)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         logger.info(f"SQLiteManager initialized with db_path: {self.db_path}")
 
+        self._pool: Optional[ConnectionPool] = None
+        self._read_pool: Optional[ConnectionPool] = None
+        if pool_size > 0:
+            self._pool = self._shared_pool(pool_size, read_only=False)
+            self._read_pool = self._shared_pool(pool_size, read_only=True)
+
+        if str(self.db_path) not in SQLiteManager._migrated_paths:
+            SQLiteManager._migrated_paths.add(str(self.db_path))
+            self._apply_index_migrations()
+
+    def _shared_pool(self, pool_size: int, read_only: bool) -> ConnectionPool:
+        """DB 경로별 공유 풀 조회 (없으면 생성)"""
+        key = (str(self.db_path), read_only)
+        with SQLiteManager._pools_lock:
+            pool = SQLiteManager._pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(
+                    self.db_path, pool_size, self.STATEMENT_CACHE_SIZE, read_only=read_only
+                )
+                SQLiteManager._pools[key] = pool
+        return pool
+
+    def _apply_index_migrations(self) -> None:
+        """
+        성능용 인덱스 생성 (CREATE INDEX IF NOT EXISTS)
+
+        존재하지 않는 테이블은 건너뛰며, 실패 시 경고만 남기고 계속 진행합니다.
+        """
+        if not self.db_path.exists():
+            return
+
+        # WAL 등 연결 PRAGMA는 _open_connection()에서 설정됨
+        with self.get_connection() as conn:
+            tables = {
+                row[0] for row in
+                conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            }
+            index_count = conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type='index'"
+            ).fetchone()[0]
+            for table, ddl in _INDEX_MIGRATIONS:
+                if table not in tables:
+                    continue
+                try:
+                    conn.execute(ddl)
+                except sqlite3.Error as e:
+                    logger.warning(f"Index migration skipped ({table}): {e}")
+            conn.commit()
+
+            # 플래너가 새 인덱스를 선택하도록 통계 수집
+            # (통계가 없거나 인덱스가 새로 생기면 ANALYZE, 그 외에는 필요한 것만 갱신)
+            index_added = conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type='index'"
+            ).fetchone()[0] > index_count
+            has_stats = "sqlite_stat1" in tables
+            conn.execute("PRAGMA optimize" if has_stats and not index_added else "ANALYZE")
+            conn.commit()
+
     @contextmanager
-    def get_connection(self):
+    def get_connection(self, read_only: bool = False):
         """
         데이터베이스 연결 컨텍스트 매니저
 
+        Args:
+            read_only: True면 PRAGMA query_only=1로 쓰기를 차단 (조회 전용 엔드포인트).
+                풀 사용 시 조회 전용 연결 풀에서 꺼내므로 쓰기 연결과 섞이지 않음
+
         Yields:
             sqlite3.Connection: SQLite 연결 객체
 
@@ -38,15 +278,23 @@ class SQLiteManager:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM lines")
         """
+        if self._pool is not None:
+            pool = self._read_pool if read_only else self._pool
+            conn = pool.acquire()
+            try:
+                yield conn
+            except sqlite3.Error as e:
+                logger.error(f"Database connection error: {e}")
+                raise
+            finally:
+                pool.release(conn)
+            return
+
         conn = None
         try:
-            conn = sqlite3.connect(
-                str(self.db_path),
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-            )
-            conn.row_factory = sqlite3.Row
-            # Enable Foreign Key constraints
-            conn.execute("PRAGMA foreign_keys = ON")
+            conn = _open_connection(self.db_path, self.STATEMENT_CACHE_SIZE)
+            if read_only:
+                conn.execute("PRAGMA query_only=1")
             yield conn
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
@@ -55,6 +303,35 @@ class SQLiteManager:
             if conn:
                 conn.close()
 
+    @contextmanager
+    def tune_for_bulk(self, conn: sqlite3.Connection):
+        """
+        대량 적재용 PRAGMA 튜닝 컨텍스트 매니저 (CSV import 등)
+
+        페이지 캐시(64 MiB)와 mmap(256 MiB)을 일시적으로 키웁니다. synchronous=NORMAL과
+        temp_store=MEMORY는 _CONNECTION_PRAGMAS로 모든 연결에 이미 설정되어 있습니다.
+        블록을 벗어날 때 커밋되지 않은 트랜잭션은 롤백되고, cache_size/mmap_size는
+        원래 값으로 복원됩니다 (풀 연결을 재사용하는 이후 요청에 남지 않도록).
+
+        Args:
+            conn: get_connection()으로 얻은 연결
+
+        Example:
+            with manager.get_connection() as conn, manager.tune_for_bulk(conn):
+                conn.executemany(...)
+        """
+        previous_cache = conn.execute("PRAGMA cache_size").fetchone()[0]
+        previous_mmap = conn.execute("PRAGMA mmap_size").fetchone()[0]
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped I/O
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.execute(f"PRAGMA cache_size={int(previous_cache)}")
+            conn.execute(f"PRAGMA mmap_size={int(previous_mmap)}")
+
     def execute_script(self, sql_script: str) -> None:
         """
         SQL 스크립트 실행 (여러 개의 SQL 문)
@@ -235,12 +512,33 @@ class SQLiteManager:
         """
         return self.db_path.exists()
 
+    def warm_pool(self) -> int:
+        """
+        공유 연결 풀을 미리 채우기 (애플리케이션 시작 시)
+
+        Returns:
+            새로 만든 연결 수 (풀을 사용하지 않으면 0)
+        """
+        if self._pool is None:
+            return 0
+        return self._pool.warm() + self._read_pool.warm()
+
+    @classmethod
+    def close_pools(cls) -> None:
+        """
+        모든 공유 연결 풀의 유휴 연결 닫기 (애플리케이션 종료 시)
+        """
+        with cls._pools_lock:
+            pools, cls._pools = list(cls._pools.values()), {}
+        for pool in pools:
+            pool.close_all()
+
     def close(self):
         """
         SQLiteManager 인스턴스 종료 (호환성을 위한 메서드)
         
         Note:
-            SQLiteManager는 매번 새로운 연결을 생성하므로
+            연결은 get_connection() 단위로 생성/반환되므로 (풀은 DB 경로별로 공유)
             인스턴스 레벨에서 닫을 연결이 없습니다.
             이 메서드는 기존 코드와의 호환성을 위해 제공됩니다.
         """
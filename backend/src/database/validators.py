@@ -6,8 +6,10 @@ Provides business logic validation for database operations
 """
 
 import re
+import sqlite3
+import time
 import ipaddress
-from typing import Optional
+from typing import Dict, FrozenSet, Optional, Tuple
 from src.database.sqlite_manager import SQLiteManager
 from src.api.exceptions import ForeignKeyError, ValidationError
 
@@ -191,6 +193,100 @@ def validate_polling_group_exists(db: SQLiteManager, group_id: int) -> bool:
     return True
 
 
+# Tag foreign key (polling_group_id) checked on the caller's connection
+_SQL_TAG_FKS = "SELECT EXISTS(SELECT 1 FROM polling_groups WHERE id = ?)"
+
+
+def validate_tag_fks(
+    db: SQLiteManager,
+    polling_group_id: Optional[int] = None,
+    conn: Optional[sqlite3.Connection] = None
+) -> bool:
+    """
+    Validate a tag's foreign key (polling group) with a single query
+
+    tags.plc_code has no foreign key and is not checked here.
+
+    Args:
+        db: Database manager
+        polling_group_id: Polling group ID to check (None to skip)
+        conn: Open connection to run the check on (e.g. the caller's write
+            connection); a pooled connection is used when omitted
+
+    Returns:
+        True if the polling group exists (or none was given)
+
+    Raises:
+        ForeignKeyError: If the polling group is not found
+    """
+    if polling_group_id is None:
+        return True
+
+    if conn is None:
+        with db.get_connection(read_only=True) as conn:
+            return validate_tag_fks(db, polling_group_id, conn)
+
+    if not conn.execute(_SQL_TAG_FKS, (polling_group_id,)).fetchone()[0]:
+        raise ForeignKeyError(
+            message="Polling group not found",
+            detail=f"polling_group_id {polling_group_id} not found"
+        )
+    return True
+
+
+# ==============================================================================
+# Cached Lookups
+# ==============================================================================
+
+# Bumped by invalidate_tag_lookups(); cached entries from older generations are rebuilt
+_lookup_generation = 0
+# Upper bound on entry age, for plc_connections changes made outside this process
+_LOOKUP_TTL_SECONDS = 60.0
+# Registered PLC codes per database file: db_path -> (generation, loaded_at, plc codes)
+_plc_codes_cache: Dict[str, Tuple[int, float, FrozenSet[str]]] = {}
+
+_SQL_PLC_CODES = "SELECT plc_code FROM plc_connections"
+
+
+def invalidate_tag_lookups() -> None:
+    """
+    Invalidate cached lookups used by tag validation (e.g. CSV import)
+
+    Call after plc_connections rows are created, updated or deleted.
+    """
+    global _lookup_generation
+    _lookup_generation += 1
+
+
+def get_known_plc_codes(db: SQLiteManager) -> FrozenSet[str]:
+    """
+    Get all registered PLC codes, cached until invalidate_tag_lookups() is called
+
+    Entries also expire after _LOOKUP_TTL_SECONDS so edits made by other
+    processes (scripts, a second server) are eventually picked up.
+
+    Args:
+        db: Database manager
+
+    Returns:
+        Set of plc_code values in plc_connections
+    """
+    generation = _lookup_generation
+    now = time.monotonic()
+    key = str(db.db_path)
+    cached = _plc_codes_cache.get(key)
+    if cached is not None and cached[0] == generation and now - cached[1] < _LOOKUP_TTL_SECONDS:
+        return cached[2]
+
+    with db.get_connection(read_only=True) as conn:
+        codes = frozenset(row[0] for row in conn.execute(_SQL_PLC_CODES))
+
+    # Tagged with the generation read before the query, so an invalidation
+    # that races with this rebuild still forces the next call to reload
+    _plc_codes_cache[key] = (generation, now, codes)
+    return codes
+
+
 # ==============================================================================
 # Unique Constraint Validation
 # ==============================================================================
@@ -5,6 +5,7 @@ Load Oracle connection parameters from environment variables with validation.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from dataclasses import dataclass
 from src.config.paths import get_backup_dir
@@ -170,6 +171,22 @@ def load_config_from_env() -> OracleConfig:
     )
 
 
+@lru_cache(maxsize=1)
+def load_cached_config() -> OracleConfig:
+    """
+    Oracle configuration from the environment, parsed once per process
+
+    For read-only callers such as the oracle-connection-info endpoints.
+    PUT /api/system/env-config calls load_cached_config.cache_clear() after
+    rewriting .env, so the next call parses the environment again. A failed
+    load raises and is not cached, so the next call retries.
+
+    Returns:
+        OracleConfig instance shared by all callers
+    """
+    return load_config_from_env()
+
+
 def load_buffer_config_from_env() -> dict:
     """
     Load buffer configuration from environment variables
@@ -6,6 +6,7 @@ Orchestrates all polling threads and manages polling group lifecycle.
 
 import logging
 import sqlite3
+from contextlib import closing
 from typing import Dict, List, Optional
 from pathlib import Path
 from .models import PollingGroup, PollingMode, ThreadState
@@ -107,67 +108,68 @@ class PollingEngine:
         groups = []
 
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            # Load polling groups with PLC info
-            cursor.execute("""
-                SELECT pg.id, pg.group_name, pg.polling_mode, pg.polling_interval_ms,
-                       pg.group_category, pg.is_active, pg.plc_code
-                FROM polling_groups pg
-                ORDER BY pg.id
-            """)
-
-            rows = cursor.fetchall()
-            logger.info(f"Found {len(rows)} polling groups in database")
-
-            for row in rows:
-                # Skip if no PLC assigned
-                if not row['plc_code']:
-                    logger.warning(f"Polling group {row['group_name']} has no PLC assigned, skipping")
-                    continue
-
-                # Load tags for this group (must match both polling_group_id and plc_code)
+            # One-off read-only connection, closed even on error. A SQLiteManager here
+            # would rerun its index migrations and ANALYZE on every config load.
+            db_uri = self.db_path.resolve().as_uri() + "?mode=ro"
+            with closing(sqlite3.connect(db_uri, uri=True)) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+
+                # Load polling groups with PLC info
                 cursor.execute("""
-                    SELECT tag_address
-                    FROM tags
-                    WHERE polling_group_id = ?
-                      AND plc_code = ?
-                      AND is_active = 1
-                    ORDER BY tag_address
-                """, (row['id'], row['plc_code']))
-
-                tag_rows = cursor.fetchall()
-
-                # Skip if no tags
-                if not tag_rows:
-                    logger.warning(f"Polling group {row['group_name']} has no active tags, skipping")
-                    continue
-
-                plc_code = row['plc_code']
-                tag_addresses = [tag_row['tag_address'] for tag_row in tag_rows]
-
-                # Create PollingGroup
-                try:
-                    group = PollingGroup(
-                        group_id=row['id'],
-                        group_name=row['group_name'],
-                        plc_code=plc_code,
-                        mode=PollingMode(row['polling_mode']),
-                        interval_ms=row['polling_interval_ms'],
-                        group_category=row['group_category'] if row['group_category'] else 'OPERATION',
-                        is_active=bool(row['is_active']),
-                        tag_addresses=tag_addresses
-                    )
-                    groups.append(group)
-                    logger.debug(f"Loaded group {group.group_name}: {len(tag_addresses)} tags, PLC={plc_code}, category={group.group_category}")
-
-                except ValueError as e:
-                    logger.error(f"Invalid polling group configuration for {row['group_name']}: {e}")
-                    continue
-
-            conn.close()
+                    SELECT pg.id, pg.group_name, pg.polling_mode, pg.polling_interval_ms,
+                           pg.group_category, pg.is_active, pg.plc_code
+                    FROM polling_groups pg
+                    ORDER BY pg.id
+                """)
+
+                rows = cursor.fetchall()
+                logger.info(f"Found {len(rows)} polling groups in database")
+
+                for row in rows:
+                    # Skip if no PLC assigned
+                    if not row['plc_code']:
+                        logger.warning(f"Polling group {row['group_name']} has no PLC assigned, skipping")
+                        continue
+
+                    # Load tags for this group (must match both polling_group_id and plc_code)
+                    cursor.execute("""
+                        SELECT tag_address
+                        FROM tags
+                        WHERE polling_group_id = ?
+                          AND plc_code = ?
+                          AND is_active = 1
+                        ORDER BY tag_address
+                    """, (row['id'], row['plc_code']))
+
+                    tag_rows = cursor.fetchall()
+
+                    # Skip if no tags
+                    if not tag_rows:
+                        logger.warning(f"Polling group {row['group_name']} has no active tags, skipping")
+                        continue
+
+                    plc_code = row['plc_code']
+                    tag_addresses = [tag_row['tag_address'] for tag_row in tag_rows]
+
+                    # Create PollingGroup
+                    try:
+                        group = PollingGroup(
+                            group_id=row['id'],
+                            group_name=row['group_name'],
+                            plc_code=plc_code,
+                            mode=PollingMode(row['polling_mode']),
+                            interval_ms=row['polling_interval_ms'],
+                            group_category=row['group_category'] if row['group_category'] else 'OPERATION',
+                            is_active=bool(row['is_active']),
+                            tag_addresses=tag_addresses
+                        )
+                        groups.append(group)
+                        logger.debug(f"Loaded group {group.group_name}: {len(tag_addresses)} tags, PLC={plc_code}, category={group.group_category}")
+
+                    except ValueError as e:
+                        logger.error(f"Invalid polling group configuration for {row['group_name']}: {e}")
+                        continue
 
         except sqlite3.Error as e:
             logger.error(f"Database error loading polling groups: {e}")
@@ -198,6 +200,26 @@ class PollingEngine:
 
         return statuses
 
+    def running_count(self) -> int:
+        """
+        Get number of running polling groups
+
+        Cheaper than get_status_all() when only the count is needed.
+
+        Returns:
+            Number of threads in RUNNING state
+        """
+        return sum(1 for thread in self.polling_threads.values() if thread.is_running())
+
+    def group_count(self) -> int:
+        """
+        Get number of loaded polling groups
+
+        Returns:
+            Number of polling threads created by initialize()
+        """
+        return len(self.polling_threads)
+
     def start_all(self):
         """
         Start all polling threads
@@ -398,12 +420,7 @@ class PollingEngine:
         Raises:
             MaxPollingGroupsReachedError: If 10 groups are already running
         """
-        running_count = sum(
-            1 for thread in self.polling_threads.values()
-            if thread.is_running()
-        )
-
-        if running_count >= self.max_groups:
+        if self.running_count() >= self.max_groups:
             raise MaxPollingGroupsReachedError(
                 f"Maximum polling groups ({self.max_groups}) already running"
             )
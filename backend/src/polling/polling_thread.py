@@ -483,15 +483,13 @@ class PollingThread(ABC):
             # Load log_mode for all tags in this group in a single query
             with self._db.get_connection() as conn:
                 cursor = conn.cursor()
+                # Default to ALWAYS in SQL so the (key, value) rows feed dict() directly
                 cursor.execute("""
-                    SELECT tag_address, log_mode
+                    SELECT tag_address, COALESCE(NULLIF(log_mode, ''), 'ALWAYS')
                     FROM tags
                     WHERE polling_group_id = ? AND is_active = 1
                 """, (self.group.group_id,))
-
-                for row in cursor.fetchall():
-                    tag_address, log_mode = row
-                    tag_log_modes[tag_address] = log_mode or 'ALWAYS'  # Default to ALWAYS
+                tag_log_modes = dict(cursor.fetchall())
 
                 logger.debug(
                     f"Loaded log_modes for {len(tag_log_modes)} tags in group {self.group.group_name}"
@@ -521,16 +519,14 @@ class PollingThread(ABC):
             # Load machine_code for all tags in this group in a single query
             with self._db.get_connection() as conn:
                 cursor = conn.cursor()
+                # Tags without a machine_code are filtered in SQL so rows feed dict() directly
                 cursor.execute("""
                     SELECT tag_address, machine_code
                     FROM tags
                     WHERE polling_group_id = ? AND is_active = 1
+                      AND machine_code IS NOT NULL AND machine_code != ''
                 """, (self.group.group_id,))
-
-                for row in cursor.fetchall():
-                    tag_address, machine_code = row
-                    if machine_code:
-                        tag_machine_codes[tag_address] = machine_code
+                tag_machine_codes = dict(cursor.fetchall())
 
                 logger.debug(
                     f"Loaded machine_codes for {len(tag_machine_codes)} tags in group {self.group.group_name}"
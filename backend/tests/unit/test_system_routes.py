@@ -0,0 +1,109 @@
+"""
+@file tests/unit/test_system_routes.py
+@description
+시스템 상태 API의 ETag / 304 Not Modified 처리에 대한 단위 테스트입니다.
+
+테스트 항목:
+1. If-None-Match 일치 시 304 (단일 ETag, 목록, *, weak 비교)
+2. 엔진 상태나 uptime이 바뀌면 ETag 변경
+
+@example
+pytest tests/unit/test_system_routes.py -v
+"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import system_routes
+
+
+class _FakeEngine:
+    """running_count/group_count만 제공하는 초기화된 폴링 엔진"""
+
+    _initialized = True
+
+    def __init__(self, running, total):
+        self.running = running
+        self.total = total
+
+    def running_count(self):
+        return self.running
+
+    def group_count(self):
+        return self.total
+
+
+@pytest.fixture
+def client():
+    """system 라우터만 등록한 테스트 앱"""
+    app = FastAPI()
+    app.include_router(system_routes.router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """실행 중인 가짜 엔진 (2/3 그룹 실행)"""
+    fake = _FakeEngine(running=2, total=3)
+    monkeypatch.setattr(system_routes, "_polling_engine", fake)
+    monkeypatch.setattr(system_routes, "_system_started_at_iso", "2026-01-01T00:00:00")
+    # uptime_seconds는 None으로 고정 (요청 사이에 초가 넘어가도 ETag가 흔들리지 않도록)
+    monkeypatch.setattr(system_routes, "_system_started_monotonic", None)
+    return fake
+
+
+def _get_status(client, if_none_match=None):
+    headers = {"If-None-Match": if_none_match} if if_none_match else {}
+    return client.get("/api/system/status", headers=headers)
+
+
+class TestStatusETag:
+    """/api/system/status ETag 테스트"""
+
+    def test_not_modified_round_trip(self, client, engine):
+        """받은 ETag로 다시 요청하면 본문 없이 304와 같은 ETag를 반환"""
+        first = _get_status(client)
+        assert first.status_code == 200
+        assert first.json()["status"] == "running"
+        etag = first.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        second = _get_status(client, etag)
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert second.content == b""
+
+    @pytest.mark.parametrize("header", [
+        'W/"0000000000000000", {etag}',
+        "*",
+        "{strong}",
+    ])
+    def test_if_none_match_forms(self, client, engine, header):
+        """ETag 목록, *, weak 접두사 없는 ETag도 일치로 처리"""
+        etag = _get_status(client).headers["ETag"]
+        header = header.format(etag=etag, strong=etag[2:])
+
+        assert _get_status(client, header).status_code == 304
+
+    def test_stale_etag_gets_full_response(self, client, engine):
+        """엔진 상태가 바뀌면 새 ETag와 함께 200을 반환"""
+        etag = _get_status(client).headers["ETag"]
+        engine.running = 3
+
+        response = _get_status(client, etag)
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["polling_groups_running"] == 3
+
+    def test_uptime_change_refreshes_body(self, client, engine, monkeypatch):
+        """uptime이 바뀌면 304 대신 새 uptime_seconds를 담은 200을 반환"""
+        monkeypatch.setattr(system_routes, "_system_started_monotonic", time.monotonic() - 100)
+        etag = _get_status(client).headers["ETag"]
+        monkeypatch.setattr(system_routes, "_system_started_monotonic", time.monotonic() - 500)
+
+        response = _get_status(client, etag)
+        assert response.status_code == 200
+        assert response.json()["uptime_seconds"] >= 500
@@ -0,0 +1,250 @@
+"""
+@file tests/unit/test_tags_routes.py
+@description
+태그 API의 페이지네이션, CSV import 배치, Oracle 동기화 배치에 대한 단위 테스트입니다.
+실제 DB(data/scada.db)의 테이블 스키마를 임시 DB에 복제해서 사용합니다 (원본은 읽기 전용).
+
+테스트 항목:
+1. 필터 + keyset 커서(next_cursor) 페이지 순회 (마지막 페이지 포함, 스트리밍 페이지 포함)
+2. _insert_import_batch 중복 건너뛰기 및 NOT NULL 오류 행 분리 (bisection)
+3. Oracle 동기화 created/updated 집계 (_execute_sync_batch 포함)
+
+@example
+pytest tests/unit/test_tags_routes.py -v
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import tags_routes
+from src.api.dependencies import get_db
+from src.database.sqlite_manager import SQLiteManager
+
+SHIPPED_DB = Path(__file__).resolve().parent.parent.parent / "data" / "scada.db"
+SCHEMA_TABLES = ("plc_connections", "polling_groups", "tags")
+DUPLICATE_ERROR = "UNIQUE constraint failed: tags.plc_code, tags.tag_address"
+
+
+def _tag_params(plc_code, tag_address, tag_name="TAG"):
+    """_TAG_INSERT_BODY 컬럼 순서의 파라미터 튜플"""
+    return (plc_code, None, tag_address, tag_name, "INT", None, 1.0, "M01", "ALWAYS", None, 1)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """실제 스키마의 빈 임시 DB + 등록된 PLC 두 개"""
+    source = sqlite3.connect(f"file:{SHIPPED_DB}?mode=ro", uri=True)
+    try:
+        ddl = [
+            source.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+            ).fetchone()[0]
+            for name in SCHEMA_TABLES
+        ]
+    finally:
+        source.close()
+
+    db_path = tmp_path / "scada.db"
+    conn = sqlite3.connect(db_path)
+    for statement in ddl:
+        conn.execute(statement)
+    conn.executemany(
+        "INSERT INTO plc_connections (plc_code, plc_name, ip_address) VALUES (?, ?, ?)",
+        [("PLC01", "PLC 1", "192.168.0.1"), ("PLC02", "PLC 2", "192.168.0.2")]
+    )
+    conn.commit()
+    conn.close()
+
+    return SQLiteManager(str(db_path), pool_size=2)
+
+
+@pytest.fixture
+def client(db):
+    """tags 라우터만 등록한 테스트 앱"""
+    app = FastAPI()
+    app.include_router(tags_routes.router)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def _insert_tags(db, rows):
+    with db.get_connection() as conn:
+        conn.executemany(tags_routes._INSERT_TAG_SQL, rows)
+        conn.commit()
+    tags_routes.invalidate_tag_caches()
+
+
+def _walk_pages(client, limit, **filters):
+    """next_cursor를 따라 모든 페이지를 읽고 (태그 id 목록, 페이지 목록) 반환"""
+    pages = []
+    params = {"limit": limit, **filters}
+    while True:
+        response = client.get("/api/tags", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        pages.append(page)
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+    ids = [item["id"] for page in pages for item in page["items"]]
+    return ids, pages
+
+
+class TestListTagsCursor:
+    """필터와 keyset 커서 페이지 순회 테스트"""
+
+    def test_cursor_walks_filtered_tags_to_last_page(self, db, client):
+        """PLC01 태그만 id 내림차순으로 빠짐없이 반환하고 마지막 페이지에서 커서가 끝남"""
+        # PLC01 7개, PLC02 3개를 섞어서 삽입
+        rows = []
+        for i in range(10):
+            plc_code = "PLC02" if i % 3 == 2 else "PLC01"
+            rows.append(_tag_params(plc_code, f"D{i}"))
+        _insert_tags(db, rows)
+
+        with db.get_connection() as conn:
+            expected = [
+                row[0] for row in
+                conn.execute("SELECT id FROM tags WHERE plc_code = 'PLC01' ORDER BY id DESC")
+            ]
+        assert len(expected) == 7
+
+        ids, pages = _walk_pages(client, limit=3, plc_code="PLC01")
+
+        assert ids == expected
+        assert [len(page["items"]) for page in pages] == [3, 3, 1]
+        assert pages[-1]["next_cursor"] is None
+        assert all(page["total_count"] == 7 for page in pages)
+        assert all(item["plc_code"] == "PLC01" for page in pages for item in page["items"])
+
+    def test_cursor_on_exactly_full_last_page(self, db, client):
+        """행 수가 limit의 배수면 빈 마지막 페이지에서 커서가 끝남"""
+        _insert_tags(db, [_tag_params("PLC01", f"D{i}") for i in range(6)])
+
+        ids, pages = _walk_pages(client, limit=3, plc_code="PLC01")
+
+        assert len(ids) == len(set(ids)) == 6
+        assert [len(page["items"]) for page in pages] == [3, 3, 0]
+        assert pages[-1]["next_cursor"] is None
+
+    def test_cursor_on_streamed_pages(self, db, client):
+        """스트리밍 응답(limit >= _STREAM_MIN_LIMIT)도 같은 커서 규칙을 따름"""
+        limit = tags_routes._STREAM_MIN_LIMIT
+        _insert_tags(db, [_tag_params("PLC01", f"D{i}") for i in range(limit * 2 + 5)])
+        _insert_tags(db, [_tag_params("PLC02", f"D{i}") for i in range(10)])
+
+        ids, pages = _walk_pages(client, limit=limit, plc_code="PLC01")
+
+        assert len(ids) == len(set(ids)) == limit * 2 + 5
+        assert ids == sorted(ids, reverse=True)
+        assert [len(page["items"]) for page in pages] == [limit, limit, 5]
+        assert pages[-1]["next_cursor"] is None
+
+
+class TestInsertImportBatch:
+    """CSV import 배치 삽입 테스트"""
+
+    def test_duplicates_are_skipped_and_reported(self, db):
+        """기존 태그 및 배치 내 중복은 건너뛰고 UNIQUE 오류로 보고"""
+        _insert_tags(db, [_tag_params("PLC01", "D0")])
+        batch = [
+            _tag_params("PLC01", "D0"),  # 기존 태그와 중복
+            _tag_params("PLC01", "D1"),
+            _tag_params("PLC01", "D1"),  # 배치 내 중복
+            _tag_params("PLC01", "D2"),
+        ]
+
+        with db.get_connection() as conn:
+            inserted, errors = tags_routes._insert_import_batch(conn, batch, [2, 3, 4, 5])
+            conn.commit()
+
+        assert inserted == 2
+        assert errors == [
+            {"row": 2, "error": DUPLICATE_ERROR},
+            {"row": 4, "error": DUPLICATE_ERROR},
+        ]
+
+    def test_not_null_failure_is_isolated_by_bisection(self, db):
+        """NOT NULL 위반 행만 실제 오류 메시지로 보고되고 주변 행은 삽입됨"""
+        batch = [_tag_params("PLC01", f"D{i}") for i in range(8)]
+        batch[5] = _tag_params("PLC01", "D5", tag_name=None)
+        batch.append(_tag_params("PLC01", "D0"))  # 중복도 함께 처리
+        row_nums = list(range(2, 2 + len(batch)))
+
+        with db.get_connection() as conn:
+            inserted, errors = tags_routes._insert_import_batch(conn, batch, row_nums)
+            conn.commit()
+            addresses = {row[0] for row in conn.execute("SELECT tag_address FROM tags")}
+
+        assert inserted == 7
+        assert len(errors) == 2
+        assert errors[0]["row"] == 7
+        assert "NOT NULL" in errors[0]["error"]
+        assert errors[1] == {"row": 10, "error": DUPLICATE_ERROR}
+        assert addresses == {f"D{i}" for i in range(8) if i != 5}
+
+
+class TestOracleSync:
+    """Oracle 태그 동기화 집계 테스트"""
+
+    @staticmethod
+    def _oracle_tag(plc_code, tag_address, tag_name="TAG", machine_code="M01"):
+        return {
+            "plc_code": plc_code,
+            "machine_code": machine_code,
+            "tag_address": tag_address,
+            "tag_name": tag_name,
+            "tag_category": "STATUS",
+            "tag_type": "INT",
+        }
+
+    def test_execute_sync_batch_reports_failed_rows(self, db):
+        """배치 실패 시 행 단위로 재실행하고 실패한 행만 보고"""
+        rows = [
+            ("PLC01", "D0", "A", None, "INT", None, 1.0, None, None, "M01", 1),
+            ("PLC01", "D1", None, None, "INT", None, 1.0, None, None, "M01", 1),  # tag_name NOT NULL
+            ("PLC01", "D2", "C", None, "INT", None, 1.0, None, None, "M01", 1),
+        ]
+
+        with db.get_connection() as conn:
+            failed, errors = tags_routes._execute_sync_batch(
+                conn, tags_routes._SQL_SYNC_UPSERT_TAG, rows
+            )
+            conn.commit()
+            count = conn.execute("SELECT COUNT(*) FROM tags").fetchone()[0]
+
+        assert failed == {1}
+        assert len(errors) == 1 and "PLC01/D1" in errors[0]
+        assert count == 2
+
+    def test_sync_counts_created_and_updated(self, db, client, monkeypatch):
+        """새 태그는 created, 기존 태그는 updated, 필수 코드가 없는 행은 errors로 집계"""
+        _insert_tags(db, [_tag_params("PLC01", "D0", "OLD"), _tag_params("PLC01", "D1", "OLD")])
+        oracle_tags = [
+            self._oracle_tag("PLC01", "D0", "NEW"),              # updated
+            self._oracle_tag("PLC01", "D1", "NEW"),              # updated
+            self._oracle_tag("PLC01", "D2"),                     # created
+            self._oracle_tag("PLC02", "D0"),                     # created
+            self._oracle_tag("PLC99", "D0"),                     # created (PLC not registered locally)
+            self._oracle_tag("PLC01", "D3", machine_code=None),  # missing machine_code
+        ]
+        monkeypatch.setattr(tags_routes, "get_oracle_tags", lambda: oracle_tags)
+
+        response = client.post("/api/tags/sync-from-oracle")
+
+        assert response.status_code == 200
+        result = response.json()
+        assert result["total_oracle_tags"] == 6
+        assert result["created"] == 3
+        assert result["updated"] == 2
+        assert result["errors"] == 1
+
+        with db.get_connection() as conn:
+            names = dict(conn.execute(
+                "SELECT tag_address, tag_name FROM tags WHERE plc_code = 'PLC01'"
+            ).fetchall())
+        assert names == {"D0": "NEW", "D1": "NEW", "D2": "TAG"}
@@ -361,7 +361,7 @@ if not exist ".venv\Scripts\activate.bat" (
 echo Starting Backend server in new window...
 echo URL: http://localhost:8000
 echo API: http://localhost:8000/docs
-start "JSOPCUA Backend" cmd /k "cd /d %~dp0backend && call .venv\Scripts\activate.bat && uvicorn src.api.main:app --reload --host 0.0.0.0 --port 8000"
+start "JSOPCUA Backend" cmd /k "cd /d %~dp0backend && call .venv\Scripts\activate.bat && uvicorn src.api.main:app --reload --host 0.0.0.0 --port 8000 --ws-ping-interval 30 --ws-ping-timeout 20"
 goto MENU
 
 :DEV_ADMIN
@@ -412,7 +412,7 @@ echo.
 echo [1/3] Starting Backend...
 cd /d "%~dp0backend"
 if exist ".venv\Scripts\activate.bat" (
-    start "JSOPCUA Backend" cmd /k "cd /d %~dp0backend && call .venv\Scripts\activate.bat && uvicorn src.api.main:app --reload --host 0.0.0.0 --port 8000"
+    start "JSOPCUA Backend" cmd /k "cd /d %~dp0backend && call .venv\Scripts\activate.bat && uvicorn src.api.main:app --reload --host 0.0.0.0 --port 8000 --ws-ping-interval 30 --ws-ping-timeout 20"
 ) else (
     echo [WARNING] No Backend venv
 )